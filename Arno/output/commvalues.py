@@ -2,19 +2,39 @@
 """
 Translation of VBA module mCommValues to Python (1:1 behavior as closely as practical).
 
-- Mortality tables are loaded lazily from MortalityTables.xml on first access.
-- Caching replicates the VBA Dictionary cache used in Act_Dx / Act_Cx / Act_Nx / Act_Mx / Act_Rx.
+- Mortality tables are loaded lazily from MortalityTables.xml on first access
+  and kept as NumPy arrays indexed by age.
+- All commutation vectors (lx, tx, Dx, Cx, Nx, Mx, Rx) are computed by one kernel,
+  _build_all_commvecs, which is JIT-compiled with numba when it is installed.
+- Instead of the VBA per-age Dictionary cache, the full vector bundle (CommVecs) is
+  cached per (mortality table vector, interest rate); Act_Dx / Act_Nx / Act_Mx / Act_Rx
+  are array lookups into that bundle.
+- Vec_* return float64 ndarrays (read-only views into the bundle, or copies where the
+  VBA loop leaves the last element at 0) instead of lists of floats.
 """
 
 from __future__ import annotations
 
 import math
 import os
+import types
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel then runs as plain Python
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 from constants import (
     ROUND_LX,
@@ -27,21 +47,28 @@ from constants import (
     MAX_AGE,
 )
 
-# --- VBA: Dim cache As Object
-cache: Optional[Dict[str, float]] = None
+# --- VBA: Dim cache As Object (here: one CommVecs bundle per (table vector, interest rate))
+cache: Optional[Dict[Tuple[str, float], CommVecs]] = None
 
-# --- Mortality table storage (lazy-loaded)
-_tables_loaded: bool = False
-_qx_tables: Dict[str, List[float]] = {}  # key: e.g. "DAV1994_T_M" -> list indexed by age (xy)
+# --- Mortality table storage (lazy-loaded; None until MortalityTables.xml has been read)
+_qx_tables: Optional[Dict[str, np.ndarray]] = None  # key: e.g. "DAV1994_T_M" -> array indexed by age (xy)
+_px_tables: Dict[str, np.ndarray] = {}  # same keys: 1 - qx, precomputed at load
 
 
 # ----------------------------
 # Helpers (Excel-like rounding)
 # ----------------------------
+# Set to True to build commutation vectors with the Decimal reference rounding
+# (slow, pure Python; useful to verify the fast path against Excel's ROUND semantics).
+# Call InitializeCache() after switching it so cached bundles are rebuilt.
+DEBUG_ROUND: bool = False
+
+
 def _excel_round(value: float, digits: int) -> float:
     """
     Excel/VBA WorksheetFunction.Round uses "half away from zero" (ROUND_HALF_UP).
     Python's round() is bankers rounding, so we emulate Excel with Decimal.
+    Reference implementation for _fast_round (see DEBUG_ROUND).
     """
     if digits >= 0:
         quant = Decimal("1").scaleb(-digits)  # 10**(-digits)
@@ -52,10 +79,27 @@ def _excel_round(value: float, digits: int) -> float:
     return float(d.quantize(quant, rounding=ROUND_HALF_UP))
 
 
+@njit(cache=True)
+def _fast_round(value: float, digits: int) -> float:
+    """
+    Half away from zero rounding with plain float arithmetic:
+    sign(v) * floor(|v| * 10**digits + 0.5) / 10**digits.
+    Floor is taken as float floor division, so large scaled values (e.g. lx * 1e16)
+    never pass through a machine integer.
+
+    Not bit-identical to _excel_round: the scaling and division are binary float
+    operations, so results can differ from the Decimal reference in the last bits
+    (relative differences of about 1e-15 in lx/Dx/Nx/Mx, e.g. up to ~5e-10 absolute on lx).
+    """
+    s = 10.0 ** digits
+    return math.copysign(((abs(value) * s + 0.5) // 1.0) / s, value)
+
+
 def InitializeCache() -> None:
     """VBA: Public Sub InitializeCache()"""
     global cache
     cache = {}
+    _full_lx_tx.cache_clear()
 
 
 def _ensure_cache() -> None:
@@ -64,6 +108,7 @@ def _ensure_cache() -> None:
         InitializeCache()
 
 
+@lru_cache(maxsize=1)
 def _mortality_xml_path() -> str:
     """
     Resolve MortalityTables.xml from:
@@ -79,16 +124,17 @@ def _mortality_xml_path() -> str:
 
 def _parse_float_comma_decimal(text: str) -> float:
     # XML values look like "0,01168700" -> 0.011687
-    return float(text.strip().replace(".", "").replace(",", ".") if False else text.strip().replace(",", "."))
+    return float(text.strip().replace(",", "."))
 
 
-def _load_mortality_tables_if_needed() -> None:
+def _load_mortality_tables() -> Dict[str, np.ndarray]:
     """
-    Loads MortalityTables.xml once and fills _qx_tables with vectors indexed by age.
+    Loads MortalityTables.xml into one 2D array qx[age, table] and sets
+    _qx_tables to per-table column views (no copies) indexed by age.
+    The survival probabilities px = 1 - qx are computed once here as well (_px_tables).
+    Callers check `_qx_tables is None` first, so this runs once.
     """
-    global _tables_loaded, _qx_tables
-    if _tables_loaded:
-        return
+    global _qx_tables, _px_tables
 
     path = _mortality_xml_path()
     if not os.path.isfile(path):
@@ -103,41 +149,81 @@ def _load_mortality_tables_if_needed() -> None:
         raise ValueError("MortalityTables.xml contains no <record> elements.")
 
     # Collect all tag names except 'xy'
-    table_tags = []
-    for child in list(records[0]):
-        if child.tag != "xy":
-            table_tags.append(child.tag)
+    table_tags = [child.tag for child in records[0] if child.tag != "xy"]
+    col_idx = {tag: j for j, tag in enumerate(table_tags)}
 
-    # Initialize arrays sized up to MAX_AGE (or larger if XML has more)
-    max_xy = 0
+    # Decode every record once: (age, [(column, text), ...])
+    rows = []
     for rec in records:
         xy_el = rec.find("xy")
         if xy_el is None or xy_el.text is None:
             continue
-        max_xy = max(max_xy, int(xy_el.text.strip()))
+        cells = [
+            (col_idx[el.tag], el.text)
+            for el in rec
+            if el.tag in col_idx and el.text is not None
+        ]
+        rows.append((int(xy_el.text.strip()), cells))
+
+    # Arrays sized up to MAX_AGE (or larger if XML has more)
+    max_xy = max((age for age, _ in rows), default=0)
     size = max(max_xy, MAX_AGE) + 1  # inclusive
 
-    _qx_tables = {tag.upper(): [0.0] * size for tag in table_tags}
-
-    # Fill values
-    for rec in records:
-        xy_el = rec.find("xy")
-        if xy_el is None or xy_el.text is None:
-            continue
-        age = int(xy_el.text.strip())
-
-        for tag in table_tags:
-            el = rec.find(tag)
-            if el is None or el.text is None:
-                continue
-            _qx_tables[tag.upper()][age] = _parse_float_comma_decimal(el.text)
+    # Column-major, so every per-table column view is contiguous
+    arr = np.zeros((size, len(table_tags)), dtype=np.float64, order="F")
+    for age, cells in rows:
+        for j, text in cells:
+            arr[age, j] = _parse_float_comma_decimal(text)
 
-    _tables_loaded = True
+    px = 1.0 - arr
+    _px_tables = {tag.upper(): px[:, j] for tag, j in col_idx.items()}
+    _qx_tables = {tag.upper(): arr[:, j] for tag, j in col_idx.items()}
+    return _qx_tables
 
 
 # ----------------------------
 # Core functions (VBA 1:1)
 # ----------------------------
+def _table_vector(Sex: str, TableId: str) -> str:
+    """
+    VBA: tableVector = TableId & "_" & Sex, with the normalization and
+    "table implemented" check of Act_qx.
+    """
+    sex = (Sex or "").strip().upper()
+    if sex != "M":
+        sex = "F"
+
+    table_id = (TableId or "").strip().upper()
+
+    # Implemented tables list as in VBA
+    if table_id in ("DAV1994_T", "DAV2008_T"):
+        return f"{table_id}_{sex}"
+
+    # VBA: Act_qx = 1# : Error(1)
+    # We'll raise a ValueError to reflect "table not implemented".
+    raise ValueError(f"Mortality table not implemented: {TableId}")
+
+
+def _qx_vector(Sex: str, TableId: str) -> np.ndarray:
+    """Returns the full qx array (indexed by age) for the given sex/table."""
+    tables = _qx_tables
+    if tables is None:
+        tables = _load_mortality_tables()
+
+    table_vector = _table_vector(Sex, TableId)
+    vec = tables.get(table_vector)
+    if vec is None:
+        # Table column missing from XML
+        raise KeyError(f"Mortality table column not found in XML: {table_vector}")
+    return vec
+
+
+def _px_vector(Sex: str, TableId: str) -> np.ndarray:
+    """Returns the full px = 1 - qx array (indexed by age) for the given sex/table."""
+    _qx_vector(Sex, TableId)  # loads the tables and checks table / column
+    return _px_tables[_table_vector(Sex, TableId)]
+
+
 def Act_qx(
     Age: int,
     Sex: str,
@@ -150,28 +236,171 @@ def Act_qx(
     VBA: Public Function Act_qx(...)
     Reads qx from MortalityTables.
     """
-    _load_mortality_tables_if_needed()
+    vec = _qx_vector(Sex, TableId)
+    if Age < 0 or Age >= len(vec):
+        raise IndexError(f"Age {Age} out of bounds for table {TableId} (size={len(vec)})")
+    return float(vec[Age])
 
-    sex = (Sex or "").strip().upper()
-    if sex != "M":
-        sex = "F"
 
-    table_id = (TableId or "").strip().upper()
+# ----------------------------
+# Commutation kernel
+# ----------------------------
+@njit(cache=True)
+def _build_all_commvecs(
+    px: np.ndarray,
+    i_rate: float,
+    max_age: int,
+    round_lx: int,
+    round_tx: int,
+    round_dx: int,
+    round_cx: int,
+    round_mx: int,
+    round_rx: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes (lx, tx, Dx, Cx, Nx, Mx, Rx) for ages 0..max_age from px = 1 - qx
+    in one forward pass plus two reverse sweeps, rounding every element with
+    _fast_round exactly where the VBA Vec_* functions call WorksheetFunction.Round.
+    _fast_round is called directly (not passed in), so numba's on-disk cache can be reused.
 
-    # Implemented tables list as in VBA
-    if table_id in ("DAV1994_T", "DAV2008_T"):
-        table_vector = f"{table_id}_{sex}"
-        vec = _qx_tables.get(table_vector)
-        if vec is None:
-            # Table column missing from XML
-            raise KeyError(f"Mortality table column not found in XML: {table_vector}")
-        if Age < 0 or Age >= len(vec):
-            raise IndexError(f"Age {Age} out of bounds for table {table_vector} (size={len(vec)})")
-        return float(vec[Age])
+    As in VBA, tx(max_age) and Cx(max_age) stay 0 (their loops stop at limit - 1),
+    and Nx is rounded with round_Dx.
+    """
+    size = max_age + 1
+    lx = np.zeros(size)
+    tx = np.zeros(size)
+    Dx = np.zeros(size)
+    Cx = np.zeros(size)
+    Nx = np.zeros(size)
+    Mx = np.zeros(size)
+    Rx = np.zeros(size)
+
+    v = 1.0 / (1.0 + i_rate)
+    disc = 1.0  # running discount factor v ** i (one multiply per age instead of a pow)
+
+    lx[0] = 1_000_000.0
+    for i in range(size):
+        disc_next = disc * v  # v ** (i + 1)
+        if i < max_age:
+            lx[i + 1] = _fast_round(lx[i] * px[i], round_lx)
+            tx[i] = _fast_round(lx[i] - lx[i + 1], round_tx)
+            Cx[i] = _fast_round(tx[i] * disc_next, round_cx)
+        Dx[i] = _fast_round(lx[i] * disc, round_dx)
+        disc = disc_next
+
+    Nx[max_age] = Dx[max_age]
+    Mx[max_age] = Cx[max_age]
+    for i in range(max_age - 1, -1, -1):
+        Nx[i] = _fast_round(Nx[i + 1] + Dx[i], round_dx)  # kept as in original
+        Mx[i] = _fast_round(Mx[i + 1] + Cx[i], round_mx)
+
+    Rx[max_age] = Mx[max_age]
+    for i in range(max_age - 1, -1, -1):
+        Rx[i] = _fast_round(Rx[i + 1] + Mx[i], round_rx)
+
+    return lx, tx, Dx, Cx, Nx, Mx, Rx
+
+
+@lru_cache(maxsize=1)
+def _reference_kernel() -> Callable[..., Tuple[np.ndarray, ...]]:
+    """
+    Plain Python _build_all_commvecs (its numba py_func) with _fast_round rebound
+    to the Decimal _excel_round; used when DEBUG_ROUND is set.
+    """
+    py_func = getattr(_build_all_commvecs, "py_func", _build_all_commvecs)
+    return types.FunctionType(
+        py_func.__code__, {**py_func.__globals__, "_fast_round": _excel_round}, py_func.__name__
+    )
 
-    # VBA: Act_qx = 1# : Error(1)
-    # We'll raise a ValueError to reflect "table not implemented".
-    raise ValueError(f"Mortality table not implemented: {TableId}")
+
+@dataclass(frozen=True)
+class CommVecs:
+    """Commutation vectors for ages 0..max_age of one (table vector, interest rate)."""
+
+    lx: np.ndarray
+    tx: np.ndarray
+    Dx: np.ndarray
+    Cx: np.ndarray
+    Nx: np.ndarray
+    Mx: np.ndarray
+    Rx: np.ndarray
+
+
+def _build_commvecs(limit: int, Sex: str, TableId: str, InterestRate: float) -> CommVecs:
+    """
+    Runs the commutation kernel for the given table, up to MAX_AGE
+    (or further if limit exceeds it).
+    """
+    if limit < 0:
+        raise ValueError("EndAge must be -1 or a non-negative integer.")
+
+    px = _px_vector(Sex, TableId)
+    max_age = max(limit, MAX_AGE)
+    if max_age > len(px):
+        raise IndexError(f"Age {max_age - 1} out of bounds for table {TableId} (size={len(px)})")
+
+    kernel = _reference_kernel() if DEBUG_ROUND else _build_all_commvecs
+    vecs = kernel(
+        px, float(InterestRate), max_age,
+        ROUND_LX, ROUND_TX, ROUND_DX, ROUND_CX, ROUND_MX, ROUND_RX,
+    )
+    for vec in vecs:
+        vec.flags.writeable = False  # bundles are shared through the cache
+    return CommVecs(*vecs)
+
+
+def get_commvecs(
+    Sex: str,
+    TableId: str,
+    InterestRate: float,
+    BirthYear: int = 0,
+    RetirementAge: int = 0,
+    Layer: int = 1,
+) -> CommVecs:
+    """
+    Returns the cached CommVecs bundle (ages 0..MAX_AGE) for Sex/TableId/InterestRate.
+    BirthYear, RetirementAge and Layer do not enter the VBA table lookup and
+    therefore not the cache key either.
+    """
+    _ensure_cache()
+    key = (_table_vector(Sex, TableId), float(InterestRate))
+
+    bundle = cache.get(key)  # type: ignore[union-attr]
+    if bundle is None:
+        bundle = _build_commvecs(MAX_AGE, Sex, TableId, InterestRate)
+        cache[key] = bundle  # type: ignore[index]
+    return bundle
+
+
+def _check_age(Age: int, TableId: str) -> None:
+    """
+    Act_* lookups reject negative ages instead of letting them wrap to the end of
+    the vector (VBA: vec(-1) is "Subscript out of range").
+    """
+    if Age < 0:
+        raise IndexError(f"Age {Age} out of bounds for table {TableId}")
+
+
+def _commvecs_up_to(limit: int, Sex: str, TableId: str, InterestRate: float) -> CommVecs:
+    """Cached bundle if it covers limit, otherwise a one-off build up to limit."""
+    if limit <= MAX_AGE:
+        if limit < 0:
+            raise ValueError("EndAge must be -1 or a non-negative integer.")
+        return get_commvecs(Sex, TableId, InterestRate)
+    return _build_commvecs(limit, Sex, TableId, InterestRate)
+
+
+@lru_cache(maxsize=64)
+def _full_lx_tx(Sex: str, TableId: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    lx and tx (ages 0..MAX_AGE) as read-only arrays, shared by all Vec_lx / Vec_tx
+    callers of one table. Neither depends on the interest rate.
+    """
+    bundle = get_commvecs(Sex, TableId, 0.0)
+    tx = bundle.tx.copy()
+    tx[MAX_AGE] = 0.0  # VBA loop stops at limit - 1
+    tx.flags.writeable = False
+    return bundle.lx, tx
 
 
 def Vec_lx(
@@ -181,25 +410,16 @@ def Vec_lx(
     BirthYear: int = 0,
     RetirementAge: int = 0,
     Layer: int = 1,
-) -> List[float]:
+) -> np.ndarray:
     """
     VBA: Private Function Vec_lx(...)
     Creates vector of lx.
     If EndAge = -1 then created up to MAX_AGE.
     """
     limit = MAX_AGE if EndAge == -1 else EndAge
-    if limit < 0:
-        raise ValueError("EndAge must be -1 or a non-negative integer.")
-
-    vec: List[float] = [0.0] * (limit + 1)
-    vec[0] = 1_000_000.0
-
-    for i in range(1, limit + 1):
-        qx = Act_qx(i - 1, Sex, TableId, BirthYear, RetirementAge, Layer)
-        vec[i] = vec[i - 1] * (1.0 - qx)
-        vec[i] = _excel_round(vec[i], ROUND_LX)
-
-    return vec
+    if 0 <= limit <= MAX_AGE:
+        return _full_lx_tx(Sex, TableId)[0][: limit + 1]
+    return _commvecs_up_to(limit, Sex, TableId, 0.0).lx[: limit + 1]
 
 
 def Act_lx(
@@ -211,6 +431,9 @@ def Act_lx(
     Layer: int = 1,
 ) -> float:
     """VBA: Public Function Act_lx(...)"""
+    _check_age(Age, TableId)
+    if 0 <= Age <= MAX_AGE:
+        return float(_full_lx_tx(Sex, TableId)[0][Age])
     vec = Vec_lx(Age, Sex, TableId, BirthYear, RetirementAge, Layer)
     return float(vec[Age])
 
@@ -222,23 +445,19 @@ def Vec_tx(
     BirthYear: int = 0,
     RetirementAge: int = 0,
     Layer: int = 1,
-) -> List[float]:
+) -> np.ndarray:
     """
     VBA: Private Function Vec_tx(...)
     Creates vector of tx (# deaths)
     """
     limit = MAX_AGE if EndAge == -1 else EndAge
-    if limit < 0:
-        raise ValueError("EndAge must be -1 or a non-negative integer.")
-
-    vec: List[float] = [0.0] * (limit + 1)
-
-    tempLx = Vec_lx(limit, Sex, TableId, BirthYear, RetirementAge, Layer)
-
-    for i in range(0, limit):
-        vec[i] = tempLx[i] - tempLx[i + 1]
-        vec[i] = _excel_round(vec[i], ROUND_TX)
+    if 0 <= limit <= MAX_AGE:
+        tx = _full_lx_tx(Sex, TableId)[1]
+    else:
+        tx = _commvecs_up_to(limit, Sex, TableId, 0.0).tx
 
+    vec = tx[: limit + 1].copy()
+    vec[limit] = 0.0  # VBA loop stops at limit - 1
     return vec
 
 
@@ -251,8 +470,11 @@ def Act_tx(
     Layer: int = 1,
 ) -> float:
     """VBA: Public Function Act_tx(...)"""
-    vec = Vec_tx(Age, Sex, TableId, BirthYear, RetirementAge, Layer)
-    return float(vec[Age])
+    _check_age(Age, TableId)
+    # Vec_tx(Age) only fills indices 0..Age-1, so (as in VBA) the result is always 0.
+    # Fetch the bundle for the argument checks only; no vector is copied.
+    _commvecs_up_to(Age, Sex, TableId, 0.0)
+    return 0.0
 
 
 def Vec_Dx(
@@ -263,40 +485,13 @@ def Vec_Dx(
     BirthYear: int = 0,
     RetirementAge: int = 0,
     Layer: int = 1,
-) -> List[float]:
+) -> np.ndarray:
     """
     VBA: Private Function Vec_Dx(...)
     Creates vector of Dx
     """
     limit = MAX_AGE if EndAge == -1 else EndAge
-    if limit < 0:
-        raise ValueError("EndAge must be -1 or a non-negative integer.")
-
-    vec: List[float] = [0.0] * (limit + 1)
-
-    v = 1.0 / (1.0 + InterestRate)
-
-    tempLx = Vec_lx(limit, Sex, TableId, BirthYear, RetirementAge, Layer)
-
-    for i in range(0, limit + 1):
-        vec[i] = tempLx[i] * (v ** i)
-        vec[i] = _excel_round(vec[i], ROUND_DX)
-
-    return vec
-
-
-def BuildCacheKey(
-    Kind: str,
-    Age: int,
-    Sex: str,
-    TableId: str,
-    InterestRate: float,
-    BirthYear: int,
-    RetirementAge: int,
-    Layer: int,
-) -> str:
-    """VBA: Private Function BuildCacheKey(...)"""
-    return f"{Kind}_{Age}_{Sex}_{TableId}_{InterestRate}_{BirthYear}_{RetirementAge}_{Layer}"
+    return _commvecs_up_to(limit, Sex, TableId, InterestRate).Dx[: limit + 1]
 
 
 def Act_Dx(
@@ -308,17 +503,12 @@ def Act_Dx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    """VBA: Public Function Act_Dx(...) with caching"""
-    _ensure_cache()
-    key = BuildCacheKey("Dx", Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    if key in cache:  # type: ignore[operator]
-        return float(cache[key])  # type: ignore[index]
-
-    vec = Vec_Dx(Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    value = float(vec[Age])
-    cache[key] = value  # type: ignore[index]
-    return value
+    """VBA: Public Function Act_Dx(...); lookup in the cached CommVecs bundle"""
+    _check_age(Age, TableId)
+    if Age > MAX_AGE:
+        vec = Vec_Dx(Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
+        return float(vec[Age])
+    return float(get_commvecs(Sex, TableId, InterestRate).Dx[Age])
 
 
 def Vec_Cx(
@@ -329,25 +519,16 @@ def Vec_Cx(
     BirthYear: int = 0,
     RetirementAge: int = 0,
     Layer: int = 1,
-) -> List[float]:
+) -> np.ndarray:
     """
     VBA: Private Function Vec_Cx(...)
     Creates vector of Cx
     """
     limit = MAX_AGE if EndAge == -1 else EndAge
-    if limit < 0:
-        raise ValueError("EndAge must be -1 or a non-negative integer.")
-
-    vec: List[float] = [0.0] * (limit + 1)
-
-    v = 1.0 / (1.0 + InterestRate)
-
-    tempTx = Vec_tx(limit, Sex, TableId, BirthYear, RetirementAge, Layer)
-
-    for i in range(0, limit):
-        vec[i] = tempTx[i] * (v ** (i + 1))
-        vec[i] = _excel_round(vec[i], ROUND_CX)
+    Cx = _commvecs_up_to(limit, Sex, TableId, InterestRate).Cx
 
+    vec = Cx[: limit + 1].copy()
+    vec[limit] = 0.0  # VBA loop stops at limit - 1
     return vec
 
 
@@ -360,17 +541,12 @@ def Act_Cx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    """VBA: Public Function Act_Cx(...) with caching"""
-    _ensure_cache()
-    key = BuildCacheKey("Cx", Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    if key in cache:  # type: ignore[operator]
-        return float(cache[key])  # type: ignore[index]
-
-    vec = Vec_Cx(Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    value = float(vec[Age])
-    cache[key] = value  # type: ignore[index]
-    return value
+    """VBA: Public Function Act_Cx(...)"""
+    _check_age(Age, TableId)
+    # Vec_Cx(Age) only fills indices 0..Age-1, so (as in VBA) the result is always 0.
+    # Fetch the bundle for the argument checks only; no vector is copied.
+    _commvecs_up_to(Age, Sex, TableId, InterestRate)
+    return 0.0
 
 
 def Vec_Nx(
@@ -380,21 +556,12 @@ def Vec_Nx(
     BirthYear: int = 0,
     RetirementAge: int = 0,
     Layer: int = 1,
-) -> List[float]:
+) -> np.ndarray:
     """
     VBA: Private Function Vec_Nx(...)
     Creates vector of Nx
     """
-    vec: List[float] = [0.0] * (MAX_AGE + 1)
-
-    tempDx = Vec_Dx(-1, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    vec[MAX_AGE] = tempDx[MAX_AGE]
-    for i in range(MAX_AGE - 1, -1, -1):
-        vec[i] = vec[i + 1] + tempDx[i]
-        vec[i] = _excel_round(vec[i], ROUND_DX)  # kept as in original
-
-    return vec
+    return get_commvecs(Sex, TableId, InterestRate).Nx
 
 
 def Act_Nx(
@@ -406,17 +573,9 @@ def Act_Nx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    """VBA: Public Function Act_Nx(...) with caching"""
-    _ensure_cache()
-    key = BuildCacheKey("Nx", Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    if key in cache:  # type: ignore[operator]
-        return float(cache[key])  # type: ignore[index]
-
-    vec = Vec_Nx(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    value = float(vec[Age])
-    cache[key] = value  # type: ignore[index]
-    return value
+    """VBA: Public Function Act_Nx(...); lookup in the cached CommVecs bundle"""
+    _check_age(Age, TableId)
+    return float(get_commvecs(Sex, TableId, InterestRate).Nx[Age])
 
 
 def Vec_Mx(
@@ -426,22 +585,13 @@ def Vec_Mx(
     BirthYear: int = 0,
     RetirementAge: int = 0,
     Layer: int = 1,
-) -> List[float]:
+) -> np.ndarray:
     """
     VBA: Private Function Vec_Mx(...)
     Creates vector of Mx
     """
-    vec: List[float] = [0.0] * (MAX_AGE + 1)
-
-    tempCx = Vec_Cx(-1, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    # Note: Vec_Cx(-1, ...) returns length MAX_AGE+1, but its last element remains 0.0
-    vec[MAX_AGE] = tempCx[MAX_AGE]
-    for i in range(MAX_AGE - 1, -1, -1):
-        vec[i] = vec[i + 1] + tempCx[i]
-        vec[i] = _excel_round(vec[i], ROUND_MX)
-
-    return vec
+    # Note: Cx(MAX_AGE) remains 0.0 in VBA, hence Mx(MAX_AGE) = 0.0 as well
+    return get_commvecs(Sex, TableId, InterestRate).Mx
 
 
 def Act_Mx(
@@ -453,17 +603,9 @@ def Act_Mx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    """VBA: Public Function Act_Mx(...) with caching"""
-    _ensure_cache()
-    key = BuildCacheKey("Mx", Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    if key in cache:  # type: ignore[operator]
-        return float(cache[key])  # type: ignore[index]
-
-    vec = Vec_Mx(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    value = float(vec[Age])
-    cache[key] = value  # type: ignore[index]
-    return value
+    """VBA: Public Function Act_Mx(...); lookup in the cached CommVecs bundle"""
+    _check_age(Age, TableId)
+    return float(get_commvecs(Sex, TableId, InterestRate).Mx[Age])
 
 
 def Vec_Rx(
@@ -473,21 +615,12 @@ def Vec_Rx(
     BirthYear: int = 0,
     RetirementAge: int = 0,
     Layer: int = 1,
-) -> List[float]:
+) -> np.ndarray:
     """
     VBA: Private Function Vec_Rx(...)
     Creates vector of Rx
     """
-    vec: List[float] = [0.0] * (MAX_AGE + 1)
-
-    tempMx = Vec_Mx(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    vec[MAX_AGE] = tempMx[MAX_AGE]
-    for i in range(MAX_AGE - 1, -1, -1):
-        vec[i] = vec[i + 1] + tempMx[i]
-        vec[i] = _excel_round(vec[i], ROUND_RX)
-
-    return vec
+    return get_commvecs(Sex, TableId, InterestRate).Rx
 
 
 def Act_Rx(
@@ -499,17 +632,9 @@ def Act_Rx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    """VBA: Public Function Act_Rx(...) with caching"""
-    _ensure_cache()
-    key = BuildCacheKey("Rx", Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    if key in cache:  # type: ignore[operator]
-        return float(cache[key])  # type: ignore[index]
-
-    vec = Vec_Rx(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    value = float(vec[Age])
-    cache[key] = value  # type: ignore[index]
-    return value
+    """VBA: Public Function Act_Rx(...); lookup in the cached CommVecs bundle"""
+    _check_age(Age, TableId)
+    return float(get_commvecs(Sex, TableId, InterestRate).Rx[Age])
 
 
 def Act_AgeCalculation(BirthDate: date, ValuationDate: date, Method: str) -> int:
@@ -531,5 +656,27 @@ def Act_AgeCalculation(BirthDate: date, ValuationDate: date, Method: str) -> int
 
     # method == "H"
     # VBA: Int(yVal - yBirth + 1#/12# * (mVal - mBirth + 5))
-    expr = (yVal - yBirth) + (1.0 / 12.0) * (mVal - mBirth + 5)
-    return int(math.floor(expr))
+    # Int() floors; with integer floor division this is exact (no 1/12 in floating point).
+    return (yVal - yBirth) + (mVal - mBirth + 5) // 12
+
+
+def Vec_AgeCalculation(
+    BirthDates: Sequence[date], ValuationDates: Sequence[date], Method: str
+) -> np.ndarray:
+    """
+    Act_AgeCalculation for arrays of dates (datetime.date or numpy datetime64),
+    e.g. for a batch of policies; returns an int64 array.
+    """
+    method = (Method or "").strip().upper()
+    if method != "K":
+        method = "H"
+
+    birth = np.asarray(BirthDates, dtype="datetime64[M]")
+    valuation = np.asarray(ValuationDates, dtype="datetime64[M]")
+
+    if method == "K":
+        return (valuation.astype("datetime64[Y]") - birth.astype("datetime64[Y]")).astype(np.int64)
+
+    # 12 * (yVal - yBirth) + (mVal - mBirth), then the same floor as Act_AgeCalculation
+    months = (valuation - birth).astype(np.int64)
+    return (months + 5) // 12
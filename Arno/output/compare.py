@@ -20,10 +20,11 @@ Assumptions:
 
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
 from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
 
 from premium_and_progress_values import (
     PolicyInputs,
@@ -43,14 +44,35 @@ ABS_TOL = 1e-8
 REL_TOL = 1e-8
 
 
-def _read(ws, addr: str) -> Any:
-    return ws[addr].value
+def _read_range(ws, min_row: int, max_row: int, max_col: int) -> List[Tuple[Any, ...]]:
+    """
+    Reads rows min_row..max_row, columns A..max_col in one pass (values only).
+    Rows beyond the end of the sheet come back as all-None, like empty cells.
+    """
+    rows = list(
+        ws.iter_rows(min_row=min_row, max_row=max_row, min_col=1, max_col=max_col, values_only=True)
+    )
+    rows += [(None,) * max_col] * (max_row - min_row + 1 - len(rows))
+    return rows
+
+
+def _cell_map(ws, min_row: int, max_row: int, max_col: int) -> Dict[str, Any]:
+    """{"B4": value, ...} for a block read with _read_range."""
+    cells: Dict[str, Any] = {}
+    for r, values in enumerate(_read_range(ws, min_row, max_row, max_col), start=min_row):
+        for c, v in enumerate(values, start=1):
+            cells[f"{get_column_letter(c)}{r}"] = v
+    return cells
 
 
-def _req(ws, addr: str) -> Any:
-    v = _read(ws, addr)
+def _read(cells: Dict[str, Any], addr: str) -> Any:
+    return cells.get(addr)
+
+
+def _req(cells: Dict[str, Any], addr: str) -> Any:
+    v = _read(cells, addr)
     if v is None:
-        raise ValueError(f"Cell {addr} is empty (sheet '{ws.title}').")
+        raise ValueError(f"Cell {addr} is empty (sheet '{SHEET_NAME}').")
     return v
 
 
@@ -80,6 +102,27 @@ def approx_equal(a: float, b: float, abs_tol: float = ABS_TOL, rel_tol: float =
     return diff <= rel_tol * scale
 
 
+def approx_equal_array(
+    a: np.ndarray, b: np.ndarray, abs_tol: float = ABS_TOL, rel_tol: float = REL_TOL
+) -> np.ndarray:
+    """Elementwise approx_equal; NaN (empty / non-numeric cell) never matches."""
+    diff = np.abs(a - b)
+    scale = np.maximum(np.maximum(np.abs(a), np.abs(b)), 1.0)
+    return (diff <= abs_tol) | (diff <= rel_tol * scale)
+
+
+def _to_float_matrix(rows: List[Tuple[Any, ...]]) -> np.ndarray:
+    """Excel value rows as a 2D float array; empty or non-numeric cells become NaN."""
+    out = np.full((len(rows), len(rows[0]) if rows else 0), np.nan)
+    for r, values in enumerate(rows):
+        for c, v in enumerate(values):
+            try:
+                out[r, c] = float(v)
+            except (TypeError, ValueError):
+                pass
+    return out
+
+
 def compare_value(name: str, py: float, xl: Any) -> Tuple[bool, str]:
     if xl is None:
         return False, f"{name}: Excel value is empty"
@@ -94,37 +137,46 @@ def compare_value(name: str, py: float, xl: Any) -> Tuple[bool, str]:
     return False, f"{name}: PY={py:.12g}  XL={xl_f:.12g}  DIFF={diff:.12g}"
 
 
-def main() -> None:
-    wb = load_workbook(EXCEL_FILE, data_only=True, keep_vba=True)
-    if SHEET_NAME not in wb.sheetnames:
-        raise ValueError(f"Worksheet '{SHEET_NAME}' not found. Available: {wb.sheetnames}")
-    ws = wb[SHEET_NAME]
+def main() -> int:
+    wb = load_workbook(EXCEL_FILE, read_only=True, data_only=True)
+    try:
+        if SHEET_NAME not in wb.sheetnames:
+            raise ValueError(f"Worksheet '{SHEET_NAME}' not found. Available: {wb.sheetnames}")
+        ws = wb[SHEET_NAME]
+
+        # Inputs and premium block live in A1:K12; progression rows are read later.
+        cells = _cell_map(ws, 1, 12, 11)
+        return _compare(ws, cells)
+    finally:
+        wb.close()
+
 
+def _compare(ws, cells: Dict[str, Any]) -> int:
     # ---- Inputs (from screenshot) ----
     policy = PolicyInputs(
-        x=_as_int(_req(ws, "B4")),
-        sex=_as_str(_req(ws, "B5")),
-        n=_as_int(_req(ws, "B6")),
-        t=_as_int(_req(ws, "B7")),
-        sum_insured=_as_float(_req(ws, "B8")),
-        pay_freq=_as_int(_req(ws, "B9")),
+        x=_as_int(_req(cells, "B4")),
+        sex=_as_str(_req(cells, "B5")),
+        n=_as_int(_req(cells, "B6")),
+        t=_as_int(_req(cells, "B7")),
+        sum_insured=_as_float(_req(cells, "B8")),
+        pay_freq=_as_int(_req(cells, "B9")),
     )
 
     tariff = TariffInputs(
-        interest_rate=_as_float(_req(ws, "E4")),
-        mortality_table=_as_str(_req(ws, "E5")),
-        alpha=_as_float(_req(ws, "E6")),
-        beta1=_as_float(_req(ws, "E7")),
-        gamma1=_as_float(_req(ws, "E8")),
-        gamma2=_as_float(_req(ws, "E9")),
-        gamma3=_as_float(_req(ws, "E10")),
-        k=_as_float(_req(ws, "E11")),
-        modal_surcharge=_as_float(_req(ws, "E12")),
+        interest_rate=_as_float(_req(cells, "E4")),
+        mortality_table=_as_str(_req(cells, "E5")),
+        alpha=_as_float(_req(cells, "E6")),
+        beta1=_as_float(_req(cells, "E7")),
+        gamma1=_as_float(_req(cells, "E8")),
+        gamma2=_as_float(_req(cells, "E9")),
+        gamma3=_as_float(_req(cells, "E10")),
+        k=_as_float(_req(cells, "E11")),
+        modal_surcharge=_as_float(_req(cells, "E12")),
     )
 
     limits = Limits(
-        min_age_flex=_as_int(_req(ws, "H4")),
-        min_term_flex=_as_int(_req(ws, "H5")),
+        min_age_flex=_as_int(_req(cells, "H4")),
+        min_term_flex=_as_int(_req(cells, "H5")),
     )
 
     # ---- Python calculation ----
@@ -167,14 +219,23 @@ def main() -> None:
 
     # Premium block comparisons
     for name, addr in prem_xl_cells.items():
-        ok, msg = compare_value(name, float(prem_py[name]), _read(ws, addr))
+        ok, msg = compare_value(name, float(prem_py[name]), _read(cells, addr))
         if not ok:
             mismatches.append(msg)
 
-    # Progression table comparisons
-    for idx, r_py in enumerate(prog_py):
-        row = start_row + idx
-        k_xl = _read(ws, f"A{row}")
+    # Progression table comparisons (whole block in one read, one vector compare)
+    prog_xl = _read_range(ws, start_row, start_row + len(prog_py) - 1, len(prog_cols))
+    names = [name for name, _ in prog_cols]
+    py_mat = prog_py.to_matrix(names)
+    xl_mat = _to_float_matrix(prog_xl)
+    int_cols = np.array([name in ("k", "Flex_phase") for name in names])
+    ok = np.where(int_cols, py_mat == xl_mat, approx_equal_array(py_mat, xl_mat))
+
+    # Messages are only formatted for rows/cells that failed.
+    for idx in np.flatnonzero(~ok.all(axis=1)):
+        r_py, r_xl = prog_py.row(idx), prog_xl[idx]
+        row = start_row + int(idx)
+        k_xl = r_xl[0]
         if k_xl is None:
             mismatches.append(f"Progression row {row}: Excel k is empty (expected {r_py['k']})")
             continue
@@ -184,11 +245,12 @@ def main() -> None:
         except Exception:
             mismatches.append(f"Progression row {row}: k non-integer in Excel ({k_xl!r})")
 
-        for name, col in prog_cols:
+        for c in np.flatnonzero(~ok[idx]):
+            name, col = prog_cols[c]
+            xl_val = r_xl[c]
             addr = f"{col}{row}"
-            xl_val = _read(ws, addr)
 
-            if name in ("k", "Flex_phase"):
+            if int_cols[c]:
                 if xl_val is None:
                     mismatches.append(f"{name} @ {addr}: Excel empty")
                     continue
@@ -201,15 +263,15 @@ def main() -> None:
                     mismatches.append(f"{name} @ {addr}: non-integer compare (PY={r_py[name]!r}, XL={xl_val!r})")
                 continue
 
-            ok, msg = compare_value(f"{name} @ {addr}", float(r_py[name]), xl_val)
-            if not ok:
+            ok_c, msg = compare_value(f"{name} @ {addr}", float(r_py[name]), xl_val)
+            if not ok_c:
                 mismatches.append(msg)
 
     # ---- Reporting ----
     print("Inputs used (from Excel):")
-    print("  Policy:", asdict(policy))
-    print("  Tariff:", asdict(tariff))
-    print("  Limits:", asdict(limits))
+    print("  Policy:", vars(policy))
+    print("  Tariff:", vars(tariff))
+    print("  Limits:", vars(limits))
 
     print("\nPremium calculation (Python):")
     for k, v in prem_py.items():
@@ -5,18 +5,23 @@ Premium and progression value calculations for an Endowment Life Insurance tarif
 This module mirrors the Excel formulas from the provided premium calculator.
 
 Assumptions:
-- The actuarial helper functions are already available as Python functions:
-    - act_nGrAx and Act_axn_k in presentvalues.py
-    - Act_Dx in commvalues.py
+- The actuarial helpers used here are:
+    - Vec_axn_k (array form of Act_axn_k) in presentvalues.py
+    - get_commvecs (cached Dx/Nx/Mx/... bundle) in commvalues.py
+- For a fixed (Sex, MortalityTable, InterestRate) the Excel formulas are
+  evaluated directly on the cached Dx/Mx vectors: act_nGrAx and Act_Dx become
+  array lookups (no per-value function calls).
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 
-from presentvalues import act_nGrAx, Act_axn_k
-from commvalues import Act_Dx
+import numpy as np
+
+from presentvalues import Vec_axn_k
+from commvalues import get_commvecs
 
 
 Number = float
@@ -51,8 +56,56 @@ class Limits:
     min_term_flex: int
 
 
-def _max0(v: int) -> int:
-    return v if v > 0 else 0
+@dataclass(frozen=True)
+class ProgressionTable:
+    """
+    Excel 'Progression values' table as one array per column (row k at index k).
+    Use as_row_dicts() for the previous list-of-dicts shape.
+    """
+
+    k: np.ndarray
+    Axn: np.ndarray
+    axn: np.ndarray
+    axt: np.ndarray
+    kVx_pp: np.ndarray
+    kDRx_pp: np.ndarray
+    kVx_pu: np.ndarray
+    kVx_MRV: np.ndarray
+    Flex_phase: np.ndarray
+    Surrender_deduction: np.ndarray
+    Surrender_value: np.ndarray
+    SumInsured_pu: np.ndarray
+
+    COLUMNS = (
+        "k",
+        "Axn",
+        "axn",
+        "axt",
+        "kVx_pp",
+        "kDRx_pp",
+        "kVx_pu",
+        "kVx_MRV",
+        "Flex_phase",
+        "Surrender_deduction",
+        "Surrender_value",
+        "SumInsured_pu",
+    )
+
+    def __len__(self) -> int:
+        return len(self.k)
+
+    def to_matrix(self, columns: Sequence[str] = COLUMNS) -> np.ndarray:
+        """2D float array [row, column] for the given column names."""
+        return np.column_stack([getattr(self, c) for c in columns]).astype(np.float64)
+
+    def row(self, idx: int) -> Dict[str, Any]:
+        """Row idx as a dict; k and Flex_phase as int, all other columns as float."""
+        return {c: getattr(self, c)[idx].item() for c in self.COLUMNS}
+
+    def as_row_dicts(self) -> List[Dict[str, Any]]:
+        """Compatibility shim: the table as one dict per k (previous return type)."""
+        cols = [getattr(self, c).tolist() for c in self.COLUMNS]
+        return [dict(zip(self.COLUMNS, values)) for values in zip(*cols)]
 
 
 def calc_premium_calculation(
@@ -87,14 +140,19 @@ def calc_premium_calculation(
     k_const = tariff.k
     modal_surcharge = tariff.modal_surcharge
 
-    ax_t = Act_axn_k(x, t, sex, mt, i, 1)
-    ax_n = Act_axn_k(x, n, sex, mt, i, 1)
+    # Specialized for fixed (sex, mt, i): lookups into the cached bundle
+    cv = get_commvecs(sex, mt, i)
+    Dx, Mx = cv.Dx, cv.Mx
+
+    ax_t = float(Vec_axn_k(x, t, sex, mt, i, 1))  # Act_axn_k(x;t;...;1)
+    ax_n = float(Vec_axn_k(x, n, sex, mt, i, 1))  # Act_axn_k(x;n;...;1)
 
-    dx_x = Act_Dx(x, sex, mt, i)
-    dx_xn = Act_Dx(x + n, sex, mt, i)
+    dx_x = float(Dx[x])
+    dx_xn = float(Dx[x + n])
+    nGrAx = float((Mx[x] - Mx[x + n]) / Dx[x])  # act_nGrAx(x;n)
 
     numerator = (
-        act_nGrAx(x, n, sex, mt, i)
+        nGrAx
         + (dx_xn / dx_x)
         + gamma1 * ax_t
         + gamma2 * (ax_n - ax_t)
@@ -107,7 +165,7 @@ def calc_premium_calculation(
     gross_modal_prem = (1.0 + modal_surcharge) / pf * (gross_annual_prem + k_const)
 
     pxt = (
-        act_nGrAx(x, n, sex, mt, i)
+        nGrAx
         + (dx_xn / dx_x)
         + t * alpha * norm_gross_annual_prem
     ) / ax_t
@@ -128,9 +186,9 @@ def calc_progression_values(
     pxt: Number,
     gross_annual_prem: Number,
     max_k: Optional[int] = None,
-) -> List[Dict[str, Any]]:
+) -> ProgressionTable:
     """
-    Mirrors Excel 'Progression values' table row-by-row.
+    Mirrors Excel 'Progression values' table, returned column-wise as a ProgressionTable.
 
     Columns (as in screenshot/formulas):
       k,
@@ -166,93 +224,86 @@ def calc_progression_values(
     if max_k is None:
         max_k = n
 
+    # Progression columns are evaluated for all k at once on the commutation vectors.
+    cv = get_commvecs(sex, mt, i)
+    Dx, Mx = cv.Dx, cv.Mx
+
     # Precompute constants that Excel references repeatedly
-    ax_t0 = Act_axn_k(x, t, sex, mt, i, 1)
-    ax_n0 = Act_axn_k(x, n, sex, mt, i, 1)
+    ax_t0 = float(Vec_axn_k(x, t, sex, mt, i, 1))
+    ax_n0 = float(Vec_axn_k(x, n, sex, mt, i, 1))
     ax_ratio_n_over_t = ax_n0 / ax_t0
 
-    dx_x5 = Act_Dx(x, sex, mt, i)  # for denominator in Axn formula when k=0
-    ax_5_at_x = Act_axn_k(x, 5, sex, mt, i, 1)  # denominator in kVx_MRV adjustment
-    dx_xn = Act_Dx(x + n, sex, mt, i)
-
-    rows: List[Dict[str, Any]] = []
-
-    for k in range(0, max_k + 1):
-        # Axn:
-        # IF(k<=n; act_nGrAx(x+k;MAX(0;n-k))+Act_Dx(x+n)/Act_Dx(x+k); 0)
-        if k <= n:
-            dx_xk = Act_Dx(x + k, sex, mt, i)
-            Axn = act_nGrAx(x + k, _max0(n - k), sex, mt, i) + (dx_xn / dx_xk)
-        else:
-            Axn = 0.0
-
-        # axn: Act_axn_k(x+k; MAX(0;n-k); ... ;1)
-        axn = Act_axn_k(x + k, _max0(n - k), sex, mt, i, 1)
-
-        # axt: Act_axn_k(x+k; MAX(0;t-k); ... ;1)
-        axt = Act_axn_k(x + k, _max0(t - k), sex, mt, i, 1)
-
-        # kVx_pp:
-        # = Axn - Pxt*axt + gamma2*(axn - Act_axn_k(x;n)/Act_axn_k(x;t)*axt)
-        kVx_pp = Axn - pxt * axt + gamma2 * (axn - ax_ratio_n_over_t * axt)
-
-        # kDRx_pp: SumInsured * kVx_pp
-        kDRx_pp = si * kVx_pp
-
-        # kVx_pu: Axn + gamma3*axn
-        kVx_pu = Axn + gamma3 * axn
-
-        # kVx_MRV:
-        # = kDRx_pp + alpha*t*GrossAnnualPrem
-        #   * Act_axn_k(x+k; MAX(5-k;0); ...;1) / Act_axn_k(x;5;...;1)
-        mr_adj_num = Act_axn_k(x + k, _max0(5 - k), sex, mt, i, 1)
-        kVx_MRV = kDRx_pp + alpha * t * gross_annual_prem * (mr_adj_num / ax_5_at_x)
-
-        # Flex. phase:
-        # IF(AND(x+k>=MinAgeFlex; k>=n-MinTermFlex); 1; 0)
-        flex_phase = 1 if ((x + k) >= min_age_flex and k >= (n - min_term_flex)) else 0
-
-        # Surrender deduction:
-        # IF(OR(k>n; flex_phase); 0; MIN(150; MAX(50; 1%*(SumInsured-kDRx_pp))))
-        if (k > n) or (flex_phase == 1):
-            surrender_deduction = 0.0
-        else:
-            surrender_deduction = min(150.0, max(50.0, 0.01 * (si - kDRx_pp)))
-
-        # Surrender value: MAX(0; kVx_MRV - surrender_deduction)
-        surrender_value = max(0.0, kVx_MRV - surrender_deduction)
-
-        # SumInsured_pu:
-        # IFERROR( IF(k>n;0; IF(k<t; kVx_MRV/kVx_pu; SumInsured)); 0)
-        try:
-            if k > n:
-                suminsured_pu = 0.0
-            else:
-                if k < t:
-                    suminsured_pu = (kVx_MRV / kVx_pu) if kVx_pu != 0 else 0.0
-                else:
-                    suminsured_pu = float(si)
-        except Exception:
-            suminsured_pu = 0.0
-
-        rows.append(
-            {
-                "k": k,
-                "Axn": float(Axn),
-                "axn": float(axn),
-                "axt": float(axt),
-                "kVx_pp": float(kVx_pp),
-                "kDRx_pp": float(kDRx_pp),
-                "kVx_pu": float(kVx_pu),
-                "kVx_MRV": float(kVx_MRV),
-                "Flex_phase": int(flex_phase),
-                "Surrender_deduction": float(surrender_deduction),
-                "Surrender_value": float(surrender_value),
-                "SumInsured_pu": float(suminsured_pu),
-            }
-        )
-
-    return rows
+    ax_5_at_x = float(Vec_axn_k(x, 5, sex, mt, i, 1))  # denominator in kVx_MRV adjustment
+
+    k_arr = np.arange(0, max_k + 1)
+    ages = x + k_arr
+    dx_xk = Dx[ages]
+    dx_xn = Dx[x + n]
+
+    # Axn:
+    # IF(k<=n; act_nGrAx(x+k;MAX(0;n-k))+Act_Dx(x+n)/Act_Dx(x+k); 0)
+    n_rem = np.maximum(n - k_arr, 0)
+    Axn_arr = np.where(
+        k_arr <= n,
+        (Mx[ages] - Mx[ages + n_rem]) / dx_xk + (dx_xn / dx_xk),
+        0.0,
+    )
+
+    # axn: Act_axn_k(x+k; MAX(0;n-k); ... ;1)
+    axn_arr = Vec_axn_k(ages, n_rem, sex, mt, i, 1)
+
+    # axt: Act_axn_k(x+k; MAX(0;t-k); ... ;1)
+    axt_arr = Vec_axn_k(ages, np.maximum(t - k_arr, 0), sex, mt, i, 1)
+
+    # kVx_pp:
+    # = Axn - Pxt*axt + gamma2*(axn - Act_axn_k(x;n)/Act_axn_k(x;t)*axt)
+    kVx_pp_arr = Axn_arr - pxt * axt_arr + gamma2 * (axn_arr - ax_ratio_n_over_t * axt_arr)
+
+    # kDRx_pp: SumInsured * kVx_pp
+    kDRx_pp_arr = si * kVx_pp_arr
+
+    # kVx_pu: Axn + gamma3*axn
+    kVx_pu_arr = Axn_arr + gamma3 * axn_arr
+
+    # kVx_MRV:
+    # = kDRx_pp + alpha*t*GrossAnnualPrem
+    #   * Act_axn_k(x+k; MAX(5-k;0); ...;1) / Act_axn_k(x;5;...;1)
+    mr_adj_num = Vec_axn_k(ages, np.maximum(5 - k_arr, 0), sex, mt, i, 1)
+    kVx_MRV_arr = kDRx_pp_arr + alpha * t * gross_annual_prem * (mr_adj_num / ax_5_at_x)
+
+    # Flex. phase:
+    # IF(AND(x+k>=MinAgeFlex; k>=n-MinTermFlex); 1; 0)
+    flex_arr = (ages >= min_age_flex) & (k_arr >= (n - min_term_flex))
+
+    # Surrender deduction:
+    # IF(OR(k>n; flex_phase); 0; MIN(150; MAX(50; 1%*(SumInsured-kDRx_pp))))
+    sd_arr = np.clip(0.01 * (si - kDRx_pp_arr), 50.0, 150.0)
+    sd_arr = np.where((k_arr > n) | flex_arr, 0.0, sd_arr)
+
+    # Surrender value: MAX(0; kVx_MRV - surrender_deduction)
+    sv_arr = np.maximum(0.0, kVx_MRV_arr - sd_arr)
+
+    # SumInsured_pu:
+    # IFERROR( IF(k>n;0; IF(k<t; kVx_MRV/kVx_pu; SumInsured)); 0)
+    # IFERROR only guards the division, so a zero kVx_pu maps to 0.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio_arr = np.where(kVx_pu_arr != 0, kVx_MRV_arr / kVx_pu_arr, 0.0)
+    sipu_arr = np.where(k_arr > n, 0.0, np.where(k_arr < t, ratio_arr, float(si)))
+
+    return ProgressionTable(
+        k=k_arr,
+        Axn=Axn_arr,
+        axn=axn_arr,
+        axt=axt_arr,
+        kVx_pp=kVx_pp_arr,
+        kDRx_pp=kDRx_pp_arr,
+        kVx_pu=kVx_pu_arr,
+        kVx_MRV=kVx_MRV_arr,
+        Flex_phase=flex_arr.astype(np.int64),
+        Surrender_deduction=sd_arr,
+        Surrender_value=sv_arr,
+        SumInsured_pu=sipu_arr,
+    )
 
 
 def calc_all(
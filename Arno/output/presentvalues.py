@@ -3,13 +3,18 @@
 Translation of VBA module mPresentValues to Python (1:1 behavior).
 
 Depends on commvalues.py (Act_Dx, Act_Nx, Act_Mx, etc.).
+Act_ag_k and Act_DeductionTerm are memoized per argument tuple.
+Vec_axn_k evaluates Act_axn_k over arrays of ages/terms from one bundle lookup.
 """
 
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Union
 
-from commvalues import Act_Dx, Act_Nx, Act_Mx
+import numpy as np
+
+from commvalues import Act_Dx, Act_Nx, Act_Mx, get_commvecs
 
 
 def Act_ax_k(
@@ -61,6 +66,47 @@ def Act_axn_k(
     return 0.0
 
 
+def Vec_axn_k(
+    Ages: Union[int, np.ndarray],
+    n: Union[int, np.ndarray],
+    Sex: str,
+    TableId: str,
+    InterestRate: float,
+    k: int,
+    BirthYear: int = 0,
+    RetirementAge: int = 0,
+    Layer: int = 1,
+) -> np.ndarray:
+    """
+    Act_axn_k elementwise over arrays of ages and terms (scalars broadcast).
+    Dx/Nx and the deduction term are fetched once per call, not once per element.
+    As in Act_axn_k, an age or age + n outside 0..MAX_AGE raises IndexError and
+    an age with Dx = 0 raises ZeroDivisionError.
+    """
+    ages = np.asarray(Ages)
+    terms = np.asarray(n)
+    if k <= 0:
+        return np.zeros(np.broadcast(ages, terms).shape)
+
+    cv = get_commvecs(Sex, TableId, InterestRate)
+    Dx, Nx = cv.Dx, cv.Nx
+    ded = Act_DeductionTerm(k, InterestRate)
+
+    ends = ages + terms
+    if ends.size:
+        lo = min(int(ages.min()), int(ends.min()))
+        hi = max(int(ages.max()), int(ends.max()))
+        if lo < 0 or hi >= len(Dx):
+            bad = lo if lo < 0 else hi
+            raise IndexError(f"Age {bad} out of bounds for table {TableId} (size={len(Dx)})")
+
+    dx_age = Dx[ages]
+    if np.any(dx_age == 0.0):
+        raise ZeroDivisionError("float division by zero")  # Act_axn_k divides by Act_Dx(Age)
+    dx_agen = Dx[ends]
+    return (Nx[ages] - Nx[ends]) / dx_age - ded * (1.0 - dx_agen / dx_age)
+
+
 def Act_nax_k(
     Age: int,
     n: int,
@@ -121,20 +167,22 @@ def act_nGrEx(
     )
 
 
+@lru_cache(maxsize=1024)
 def Act_ag_k(g: int, InterestRate: float, k: int) -> float:
     """
     VBA: Public Function Act_ag_k(...)
     """
-    v = 1.0 / (1.0 + InterestRate)
+    if k <= 0:
+        return 0.0
+    if InterestRate <= 0:
+        return float(g)
 
-    if k > 0:
-        if InterestRate > 0:
-            return (1.0 - v**g) / (1.0 - v) - Act_DeductionTerm(k, InterestRate) * (1.0 - v**g)
-        else:
-            return float(g)
-    return 0.0
+    v = 1.0 / (1.0 + InterestRate)
+    one_minus_vg = 1.0 - v**g
+    return one_minus_vg / (1.0 - v) - Act_DeductionTerm(k, InterestRate) * one_minus_vg
 
 
+@lru_cache(maxsize=1024)
 def Act_DeductionTerm(k: int, InterestRate: float) -> float:
     """
     VBA: Public Function Act_DeductionTerm(...)
@@ -143,6 +191,8 @@ def Act_DeductionTerm(k: int, InterestRate: float) -> float:
     deduction = 0.0
 
     if k > 0:
+        # Left-to-right accumulation as in the VBA loop (np.sum's pairwise order can
+        # differ in the last ulp); cached per (k, InterestRate), so the loop runs once.
         for l in range(0, k):
             deduction += (l / k) / (1.0 + (l / k) * InterestRate)
         deduction = deduction * (1.0 + InterestRate) / k
@@ -15,10 +15,12 @@ Cell mapping is based on the provided screenshot.
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
 
+import numpy as np
 from openpyxl import load_workbook
+from openpyxl.utils.cell import coordinate_to_tuple
 
 from premium_and_progress_values import (
     PolicyInputs,
@@ -33,10 +35,36 @@ EXCEL_FILE = "Tariff_Calculator.xlsm"
 SHEET_NAME = "Calculation"
 
 
-def _read(ws, addr: str) -> Any:
-    v = ws[addr].value
+Grid = List[Sequence[Any]]  # grid[row - 1][col - 1] is the value of Excel cell (row, col)
+
+
+def _read_cells(max_row: int, max_col: int) -> Grid:
+    """Reads A1:{max_col}{max_row} in one pass (values only) as rows of raw values."""
+    # Read-only streams the sheet instead of building the whole workbook in memory.
+    wb = load_workbook(EXCEL_FILE, data_only=True, read_only=True, keep_links=False)
+    try:
+        if SHEET_NAME not in wb.sheetnames:
+            raise ValueError(f"Worksheet '{SHEET_NAME}' not found. Available: {wb.sheetnames}")
+        ws = wb[SHEET_NAME]
+        rows = ws.iter_rows(min_row=1, max_row=max_row, min_col=1, max_col=max_col, values_only=True)
+        return list(rows)
+    finally:
+        wb.close()
+
+
+@lru_cache(maxsize=None)
+def _addr_rc(addr: str) -> Tuple[int, int]:
+    """"B4" -> (4, 2); each address is parsed once."""
+    return coordinate_to_tuple(addr)
+
+
+def _read(cells: Grid, addr: str) -> Any:
+    r, c = _addr_rc(addr)
+    # rows past the sheet end / short rows count as empty
+    row = cells[r - 1] if r <= len(cells) else ()
+    v = row[c - 1] if c <= len(row) else None
     if v is None:
-        raise ValueError(f"Cell {addr} is empty (sheet '{ws.title}').")
+        raise ValueError(f"Cell {addr} is empty (sheet '{SHEET_NAME}').")
     return v
 
 
@@ -69,54 +97,59 @@ def _print_kv(title: str, d: Dict[str, Any]) -> None:
             print(f"{k:>20s}: {v}")
 
 
-def _print_table(rows: List[Dict[str, Any]], cols: List[str]) -> None:
-    # simple fixed-width table printer
-    widths = {c: max(len(c), max(len(f"{r.get(c, '')}") for r in rows)) for c in cols}
-    header = " | ".join(c.ljust(widths[c]) for c in cols)
-    sep = "-+-".join("-" * widths[c] for c in cols)
+def _print_table(rows: Sequence[Sequence[Any]], cols: List[str]) -> None:
+    # simple fixed-width table printer; rows are positional (aligned with cols),
+    # every cell is formatted once
+    formatted = [[f"{v}" for v in r] for r in rows]
+    widths = [len(c) for c in cols]
+    for cells in formatted:
+        for j, cell in enumerate(cells):
+            if len(cell) > widths[j]:
+                widths[j] = len(cell)
+
+    header = " | ".join(c.ljust(w) for c, w in zip(cols, widths))
+    sep = "-+-".join("-" * w for w in widths)
     print("\nProgression values")
     print("------------------")
     print(header)
     print(sep)
-    for r in rows:
-        line = " | ".join(f"{r.get(c, '')}".ljust(widths[c]) for c in cols)
+    for cells in formatted:
+        line = " | ".join(cell.ljust(w) for cell, w in zip(cells, widths))
         print(line)
 
 
 def main() -> None:
-    wb = load_workbook(EXCEL_FILE, data_only=True, keep_vba=True)
-    if SHEET_NAME not in wb.sheetnames:
-        raise ValueError(f"Worksheet '{SHEET_NAME}' not found. Available: {wb.sheetnames}")
-    ws = wb[SHEET_NAME]
+    # All inputs live in A1:H12 and are read in one pass.
+    cells = _read_cells(max_row=12, max_col=8)
 
     # --- Inputs (from screenshot) ---
     # Policy data (A4:A9 labels, B4:B9 values)
     policy = PolicyInputs(
-        x=_as_int(_read(ws, "B4")),
-        sex=_as_str(_read(ws, "B5")),
-        n=_as_int(_read(ws, "B6")),
-        t=_as_int(_read(ws, "B7")),
-        sum_insured=_as_float(_read(ws, "B8")),
-        pay_freq=_as_int(_read(ws, "B9")),
+        x=_as_int(_read(cells, "B4")),
+        sex=_as_str(_read(cells, "B5")),
+        n=_as_int(_read(cells, "B6")),
+        t=_as_int(_read(cells, "B7")),
+        sum_insured=_as_float(_read(cells, "B8")),
+        pay_freq=_as_int(_read(cells, "B9")),
     )
 
     # Tariff data (D4:D12 labels, E4:E12 values)
     tariff = TariffInputs(
-        interest_rate=_as_float(_read(ws, "E4")),
-        mortality_table=_as_str(_read(ws, "E5")),
-        alpha=_as_float(_read(ws, "E6")),
-        beta1=_as_float(_read(ws, "E7")),
-        gamma1=_as_float(_read(ws, "E8")),
-        gamma2=_as_float(_read(ws, "E9")),
-        gamma3=_as_float(_read(ws, "E10")),
-        k=_as_float(_read(ws, "E11")),
-        modal_surcharge=_as_float(_read(ws, "E12")),
+        interest_rate=_as_float(_read(cells, "E4")),
+        mortality_table=_as_str(_read(cells, "E5")),
+        alpha=_as_float(_read(cells, "E6")),
+        beta1=_as_float(_read(cells, "E7")),
+        gamma1=_as_float(_read(cells, "E8")),
+        gamma2=_as_float(_read(cells, "E9")),
+        gamma3=_as_float(_read(cells, "E10")),
+        k=_as_float(_read(cells, "E11")),
+        modal_surcharge=_as_float(_read(cells, "E12")),
     )
 
     # Limits (G4:G5 labels, H4:H5 values)
     limits = Limits(
-        min_age_flex=_as_int(_read(ws, "H4")),
-        min_term_flex=_as_int(_read(ws, "H5")),
+        min_age_flex=_as_int(_read(cells, "H4")),
+        min_term_flex=_as_int(_read(cells, "H5")),
     )
 
     # --- Calculations ---
@@ -131,9 +164,9 @@ def main() -> None:
     )
 
     # --- Output ---
-    _print_kv("Inputs: Policy", asdict(policy))
-    _print_kv("Inputs: Tariff", asdict(tariff))
-    _print_kv("Inputs: Limits", asdict(limits))
+    _print_kv("Inputs: Policy", vars(policy))
+    _print_kv("Inputs: Tariff", vars(tariff))
+    _print_kv("Inputs: Limits", vars(limits))
 
     _print_kv("Premium calculation", premium)
 
@@ -151,14 +184,17 @@ def main() -> None:
         "Surrender_value",
         "SumInsured_pu",
     ]
-    # format floats a bit for readability
-    pretty_rows: List[Dict[str, Any]] = []
-    for r in progression:
-        pr = dict(r)
-        for c in cols:
-            if c != "k" and isinstance(pr.get(c), float):
-                pr[c] = f"{pr[c]:.8f}"
-        pretty_rows.append(pr)
+    # format floats a bit for readability (one vectorized format per column)
+    int_cols = {"k", "Flex_phase"}
+    pretty_cols = [
+        (
+            getattr(progression, c).astype(str)
+            if c in int_cols
+            else np.char.mod("%.8f", getattr(progression, c))
+        ).tolist()
+        for c in cols
+    ]
+    pretty_rows = list(zip(*pretty_cols))  # one tuple of strings per k, ordered like cols
 
     _print_table(pretty_rows, cols)
 
@@ -1,5 +1,9 @@
 import os
+import sys
 from pathlib import Path
 
 # Immediately switch to the output directory
 os.chdir(Path(__file__).resolve().parents[1])   # …/Arno/output
+
+# Add …/Arno/output to sys.path so the modules under test are importable
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,67 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+import commvalues
+
+
+@pytest.fixture
+def debug_round():
+    """Switches commvalues to the Decimal reference rounding for one test."""
+    commvalues.DEBUG_ROUND = True
+    commvalues.InitializeCache()
+    yield
+    commvalues.DEBUG_ROUND = False
+    commvalues.InitializeCache()
+
+
+@pytest.mark.parametrize("sex", ["M", "F"])
+@pytest.mark.parametrize("table_id", ["DAV1994_T", "DAV2008_T"])
+def test_fast_round_matches_reference_rounding(sex, table_id, debug_round):
+    """The float rounding path agrees with the Decimal reference up to float noise."""
+    reference = commvalues.get_commvecs(sex, table_id, 0.0175)
+
+    commvalues.DEBUG_ROUND = False
+    commvalues.InitializeCache()
+    fast = commvalues.get_commvecs(sex, table_id, 0.0175)
+
+    for name in ("lx", "Dx", "Nx", "Mx"):
+        np.testing.assert_allclose(
+            getattr(fast, name), getattr(reference, name), rtol=1e-13, atol=1e-8, err_msg=name
+        )
+
+
+@pytest.mark.parametrize("method", ["K", "H", "x"])
+def test_vec_age_calculation_matches_scalar(method):
+    """Vec_AgeCalculation equals Act_AgeCalculation for every birth/valuation month pair."""
+    births = [date(y, m, d) for y in (1960, 1979, 1980) for m in range(1, 13) for d in (1, 28)]
+    valuations = [date(y, m, 15) for y in (2024, 2026) for m in range(1, 13)]
+    pairs = [(b, v) for b in births for v in valuations]
+
+    got = commvalues.Vec_AgeCalculation([b for b, _ in pairs], [v for _, v in pairs], method)
+    expected = [commvalues.Act_AgeCalculation(b, v, method) for b, v in pairs]
+
+    assert got.dtype == np.int64
+    assert got.tolist() == expected
+
+
+def test_vec_age_calculation_accepts_datetime64():
+    births = np.array(["1980-07-31", "1980-08-01"], dtype="datetime64[D]")
+    valuations = np.array(["2026-01-01", "2026-01-01"], dtype="datetime64[D]")
+
+    got = commvalues.Vec_AgeCalculation(births, valuations, "H")
+
+    assert got.tolist() == [
+        commvalues.Act_AgeCalculation(date(1980, 7, 31), date(2026, 1, 1), "H"),
+        commvalues.Act_AgeCalculation(date(1980, 8, 1), date(2026, 1, 1), "H"),
+    ]
+
+
+@pytest.mark.parametrize("name", ["Act_lx", "Act_tx", "Act_Dx", "Act_Cx", "Act_Nx", "Act_Mx", "Act_Rx"])
+@pytest.mark.parametrize("age", [-1, -2, -commvalues.MAX_AGE - 1])
+def test_act_lookups_reject_negative_ages(name, age):
+    """Negative ages raise instead of wrapping to the end of the vector."""
+    args = (age, "M", "DAV1994_T") if name in ("Act_lx", "Act_tx") else (age, "M", "DAV1994_T", 0.0175)
+    with pytest.raises(IndexError, match="out of bounds"):
+        getattr(commvalues, name)(*args)
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from commvalues import Act_Dx
+from premium_and_progress_values import (
+    Limits,
+    PolicyInputs,
+    ProgressionTable,
+    TariffInputs,
+    calc_all,
+)
+from presentvalues import Act_axn_k, act_nGrAx
+
+POLICY = PolicyInputs(x=40, sex="M", n=30, t=20, sum_insured=100_000.0, pay_freq=12)
+TARIFF = TariffInputs(
+    interest_rate=0.0175,
+    mortality_table="DAV1994_T",
+    alpha=0.025,
+    beta1=0.025,
+    gamma1=0.0008,
+    gamma2=0.00125,
+    gamma3=0.0025,
+    k=24.0,
+    modal_surcharge=0.05,
+)
+
+
+def _reference_rows(policy, tariff, limits, pxt, gross_annual_prem, max_k):
+    """Per-row scalar evaluation of the Excel table, as calc_progression_values did it before."""
+    x, sex, n, t, si = policy.x, policy.sex, policy.n, policy.t, policy.sum_insured
+    mt, i = tariff.mortality_table, tariff.interest_rate
+
+    ax_ratio_n_over_t = Act_axn_k(x, n, sex, mt, i, 1) / Act_axn_k(x, t, sex, mt, i, 1)
+    ax_5_at_x = Act_axn_k(x, 5, sex, mt, i, 1)
+    dx_xn = Act_Dx(x + n, sex, mt, i)
+
+    rows = []
+    for k in range(max_k + 1):
+        if k <= n:
+            Axn = act_nGrAx(x + k, max(0, n - k), sex, mt, i) + dx_xn / Act_Dx(x + k, sex, mt, i)
+        else:
+            Axn = 0.0
+        axn = Act_axn_k(x + k, max(0, n - k), sex, mt, i, 1)
+        axt = Act_axn_k(x + k, max(0, t - k), sex, mt, i, 1)
+        kVx_pp = Axn - pxt * axt + tariff.gamma2 * (axn - ax_ratio_n_over_t * axt)
+        kDRx_pp = si * kVx_pp
+        kVx_pu = Axn + tariff.gamma3 * axn
+        mr_adj_num = Act_axn_k(x + k, max(0, 5 - k), sex, mt, i, 1)
+        kVx_MRV = kDRx_pp + tariff.alpha * t * gross_annual_prem * (mr_adj_num / ax_5_at_x)
+        flex_phase = 1 if (x + k >= limits.min_age_flex and k >= n - limits.min_term_flex) else 0
+        if k > n or flex_phase == 1:
+            surrender_deduction = 0.0
+        else:
+            surrender_deduction = min(150.0, max(50.0, 0.01 * (si - kDRx_pp)))
+        if k > n:
+            suminsured_pu = 0.0
+        elif k < t:
+            suminsured_pu = kVx_MRV / kVx_pu if kVx_pu != 0 else 0.0
+        else:
+            suminsured_pu = float(si)
+        rows.append(
+            {
+                "k": k,
+                "Axn": Axn,
+                "axn": axn,
+                "axt": axt,
+                "kVx_pp": kVx_pp,
+                "kDRx_pp": kDRx_pp,
+                "kVx_pu": kVx_pu,
+                "kVx_MRV": kVx_MRV,
+                "Flex_phase": flex_phase,
+                "Surrender_deduction": surrender_deduction,
+                "Surrender_value": max(0.0, kVx_MRV - surrender_deduction),
+                "SumInsured_pu": suminsured_pu,
+            }
+        )
+    return rows
+
+
+@pytest.mark.parametrize("max_k", [None, 35])
+@pytest.mark.parametrize("limits", [Limits(60, 5), Limits(50, 25)])
+def test_progression_table_matches_per_row_values(max_k, limits):
+    """row(), as_row_dicts() and to_matrix() reproduce the former per-row table."""
+    result = calc_all(POLICY, TARIFF, limits, max_k=max_k)
+    prem, table = result["premium"], result["progression"]
+    expected = _reference_rows(
+        POLICY, TARIFF, limits, prem["Pxt"], prem["GrossAnnualPrem"],
+        POLICY.n if max_k is None else max_k,
+    )
+
+    assert isinstance(table, ProgressionTable)
+    assert len(table) == len(expected)
+
+    rows = table.as_row_dicts()
+    assert len(rows) == len(expected)
+    for idx, exp in enumerate(expected):
+        for got in (rows[idx], table.row(idx)):
+            assert list(got) == list(ProgressionTable.COLUMNS)
+            assert type(got["k"]) is int and type(got["Flex_phase"]) is int
+            assert got == pytest.approx(exp, rel=1e-12, abs=1e-9)
+
+    matrix = table.to_matrix()
+    assert matrix.shape == (len(expected), len(ProgressionTable.COLUMNS))
+    np.testing.assert_allclose(
+        matrix,
+        [[exp[c] for c in ProgressionTable.COLUMNS] for exp in expected],
+        rtol=1e-12,
+        atol=1e-9,
+    )
+    np.testing.assert_array_equal(table.to_matrix(("k", "axt")), matrix[:, [0, 3]])
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from commvalues import MAX_AGE
+from presentvalues import Act_axn_k, Vec_axn_k
+
+
+@pytest.mark.parametrize("sex, table_id", [("M", "DAV1994_T"), ("F", "DAV2008_T")])
+@pytest.mark.parametrize("k", [0, 1, 4, 12])
+def test_vec_axn_k_matches_scalar(sex, table_id, k):
+    """Vec_axn_k equals Act_axn_k element-wise (ages with Dx > 0, age + n <= MAX_AGE)."""
+    ages, terms = np.meshgrid(np.arange(0, 100), np.arange(0, 25), indexing="ij")
+
+    got = Vec_axn_k(ages, terms, sex, table_id, 0.0175, k)
+
+    assert got.shape == ages.shape
+    for age, term, value in zip(ages.ravel(), terms.ravel(), got.ravel()):
+        assert value == pytest.approx(
+            Act_axn_k(int(age), int(term), sex, table_id, 0.0175, k), rel=1e-12, abs=1e-12
+        )
+
+
+def test_vec_axn_k_broadcasts_scalar_term():
+    ages = np.array([20, 40, 60])
+
+    got = Vec_axn_k(ages, 10, "M", "DAV1994_T", 0.0175, 1)
+
+    assert got.tolist() == pytest.approx(
+        [Act_axn_k(int(a), 10, "M", "DAV1994_T", 0.0175, 1) for a in ages], rel=1e-12
+    )
+
+
+@pytest.mark.parametrize("age, term", [(MAX_AGE - 5, 6), (MAX_AGE + 1, 0)])
+def test_vec_axn_k_beyond_max_age_raises_like_scalar(age, term):
+    with pytest.raises(IndexError):
+        Act_axn_k(age, term, "M", "DAV1994_T", 0.0175, 1)
+    with pytest.raises(IndexError, match="out of bounds"):
+        Vec_axn_k(np.array([40, age]), term, "M", "DAV1994_T", 0.0175, 1)
+
+
+def test_vec_axn_k_rejects_negative_ages():
+    with pytest.raises(IndexError, match="out of bounds"):
+        Vec_axn_k(np.array([-1, 40]), 5, "M", "DAV1994_T", 0.0175, 1)
+
+
+@pytest.mark.parametrize(
+    "age, term",
+    [(-1, 3), (-2, 0), (5, -6), (MAX_AGE - 5, 6), (MAX_AGE + 1, 0), (110, 5), (MAX_AGE, 0)],
+)
+def test_vec_axn_k_raises_on_same_inputs_as_scalar(age, term):
+    """Vec_axn_k raises the same exception type as Act_axn_k for invalid ages."""
+    with pytest.raises((IndexError, ZeroDivisionError)) as scalar:
+        Act_axn_k(age, term, "M", "DAV1994_T", 0.0175, 1)
+    with pytest.raises(scalar.type):
+        Vec_axn_k(np.array([40, age]), np.array([10, term]), "M", "DAV1994_T", 0.0175, 1)
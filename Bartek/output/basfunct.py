@@ -12,7 +12,10 @@ Data access:
 
 Conventions:
 - Excel ROUND (half-up) implemented via decimal quantize.
-- Caching mirrors VBA: Dx/Cx/Nx/Mx/Rx are cached by scalar key.
+- qx values are kept as an ndarray (rows = ages, columns = table vectors).
+- Instead of VBA's per-age Dictionary cache, all commutation columns
+  (lx, tx, Dx, Cx, Nx, Mx, Rx) are built once per (Sex, TableId, InterestRate, ...)
+  and cached as ndarrays; Act_Dx / Act_Nx / Act_Mx / Act_Rx are array lookups.
 """
 
 from __future__ import annotations
@@ -21,8 +24,9 @@ from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 # ----------------------------
@@ -58,15 +62,35 @@ _DATA_DIR: Path = _default_data_dir()
 _tables_df: Optional[pd.DataFrame] = None
 _tables_header: Optional[List[str]] = None
 _tables_data: Optional[pd.DataFrame] = None
+_qx_matrix: Optional[np.ndarray] = None
+_qx_age_rows: Optional[Dict[float, int]] = None
+
+# cache_clear of memos built on basfunct results elsewhere (e.g. outfunc's premium
+# functions); set_data_dir() and InitializeCache() call them.
+_dependent_cache_clears: List[Callable[[], None]] = []
+
+
+def register_dependent_cache(cache_clear: Callable[[], None]) -> None:
+    """Register a cache_clear to run whenever the tables or commutation cache are reset."""
+    _dependent_cache_clears.append(cache_clear)
+
+
+def _clear_dependent_caches() -> None:
+    for cache_clear in _dependent_cache_clears:
+        cache_clear()
 
 
 def set_data_dir(path: str | Path) -> None:
     """Set directory containing tables.csv (and optionally other CSVs)."""
-    global _DATA_DIR, _tables_df, _tables_header, _tables_data
+    global _DATA_DIR, _tables_df, _tables_header, _tables_data, _qx_matrix, _qx_age_rows, cache
     _DATA_DIR = Path(path).resolve()
     _tables_df = None
     _tables_header = None
     _tables_data = None
+    _qx_matrix = None
+    _qx_age_rows = None
+    cache = None  # commutation columns depend on the loaded tables
+    _clear_dependent_caches()
 
 
 def _load_tables() -> Tuple[List[str], pd.DataFrame]:
@@ -120,6 +144,34 @@ def _load_tables() -> Tuple[List[str], pd.DataFrame]:
     return table_names, data
 
 
+def _load_qx_matrix() -> Tuple[List[str], Optional[Dict[float, int]], np.ndarray]:
+    """
+    qx values of tables.csv as a float ndarray [row, table column].
+
+    Returns:
+        (table_names, age_rows, matrix)
+        age_rows: age -> first row with that age, or None if the age column
+                  is not numeric (rows are then addressed by position)
+    """
+    global _qx_matrix, _qx_age_rows
+    table_names, data = _load_tables()
+    if _qx_matrix is not None:
+        return table_names, _qx_age_rows, _qx_matrix
+
+    matrix = data[table_names].to_numpy(dtype=float)
+    age_series = pd.to_numeric(data["Age"], errors="coerce")
+    age_rows: Optional[Dict[float, int]] = None
+    if age_series.notna().any():
+        age_rows = {}
+        for row, age in enumerate(age_series):
+            if pd.notna(age):
+                age_rows.setdefault(float(age), row)
+
+    _qx_matrix = matrix
+    _qx_age_rows = age_rows
+    return table_names, age_rows, matrix
+
+
 def _load_name_value_csv(filename: str) -> Dict[str, str]:
     """
     Load Name/Value CSV into dict; included to satisfy 'available data sources' rule.
@@ -154,26 +206,31 @@ def excel_round(x: float, digits: int) -> float:
 # Cache (from mCommValues)
 # ----------------------------
 
-cache: Optional[Dict[str, float]] = None
+# (Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
+CacheKey = Tuple[str, str, float, int, int, int]
+
+
+@dataclass(frozen=True)
+class CommColumns:
+    """Commutation columns for ages 0..max_Age (or further) of one cache key."""
+
+    lx: np.ndarray
+    tx: np.ndarray
+    Dx: np.ndarray
+    Cx: np.ndarray
+    Nx: np.ndarray
+    Mx: np.ndarray
+    Rx: np.ndarray
+
+
+cache: Optional[Dict[CacheKey, CommColumns]] = None
 
 
 def InitializeCache() -> None:
     """VBA: InitializeCache creates Scripting.Dictionary."""
     global cache
     cache = {}
-
-
-def BuildCacheKey(
-    Kind: str,
-    Age: int,
-    Sex: str,
-    TableId: str,
-    InterestRate: float,
-    BirthYear: int,
-    RetirementAge: int,
-    Layer: int,
-) -> str:
-    return f"{Kind}_{Age}_{Sex}_{TableId}_{InterestRate}_{BirthYear}_{RetirementAge}_{Layer}"
+    _clear_dependent_caches()
 
 
 # ----------------------------
@@ -207,29 +264,132 @@ def Act_qx(
 
     table_vector = f"{table_id}_{sex}"
 
-    table_names, data = _load_tables()
+    table_names, age_rows, matrix = _load_qx_matrix()
     try:
         col_idx = table_names.index(table_vector)
     except ValueError as e:
         raise KeyError(f"Table vector not found in tables.csv header row: {table_vector!r}") from e
 
-    col = table_names[col_idx]
-
     # Prefer explicit ages if present; else positional (Age=0 -> first data row)
-    age_series = pd.to_numeric(data["Age"], errors="coerce")
-    if age_series.notna().any():
-        matches = data.loc[age_series == Age, col]
-        if matches.empty:
+    if age_rows is not None:
+        row = age_rows.get(Age)
+        if row is None:
             raise IndexError(f"Age {Age} not found in tables.csv age column.")
-        val = float(matches.iloc[0])
     else:
-        if Age < 0 or Age >= len(data):
+        if Age < 0 or Age >= matrix.shape[0]:
             raise IndexError(f"Age {Age} out of bounds for mortality table rows.")
-        val = float(data.iloc[Age][col])
+        row = Age
+    val = float(matrix[row, col_idx])
 
     return val
 
 
+def _round_column(values: np.ndarray, digits: int) -> np.ndarray:
+    """excel_round applied element-wise."""
+    return np.array([excel_round(float(x), digits) for x in values], dtype=float)
+
+
+def _build_columns(
+    limit: int,
+    Sex: str,
+    TableId: str,
+    InterestRate: float,
+    BirthYear: int,
+    RetirementAge: int,
+    Layer: int,
+) -> CommColumns:
+    """
+    Builds all commutation columns up to max(limit, max_Age) with the VBA
+    recursions and per-step rounding (Vec_lx .. Vec_Rx). Nx/Mx/Rx always
+    cover ages 0..max_Age, as in VBA.
+    """
+    if limit < 0:
+        raise IndexError(f"EndAge must be -1 or a non-negative integer, got {limit}.")
+    n = max(limit, max_Age)
+
+    # lx: each step is rounded, so this stays a sequential recursion
+    lx = np.zeros(n + 1)
+    lx[0] = 1_000_000.0
+    for i in range(1, n + 1):
+        qx = Act_qx(i - 1, Sex, TableId, BirthYear, RetirementAge, Layer)
+        lx[i] = excel_round(float(lx[i - 1]) * (1.0 - qx), round_lx)
+
+    # v**i via Python float pow: np.power can differ from it in the last ulp
+    v = 1.0 / (1.0 + InterestRate)
+    v_pow = np.array([v**i for i in range(n + 2)])
+
+    # VBA loops for tx / Cx stop at limit - 1, leaving the last element at 0
+    tx = np.zeros(n + 1)
+    tx[:n] = _round_column(lx[:n] - lx[1:], round_tx)
+    Dx = _round_column(lx * v_pow[: n + 1], round_Dx)
+    Cx = np.zeros(n + 1)
+    Cx[:n] = _round_column(tx[:n] * v_pow[1 : n + 1], round_Cx)
+
+    # Nx / Mx / Rx are built from Vec_Dx(-1) / Vec_Cx(-1), i.e. up to max_Age
+    Cx_max = Cx[: max_Age + 1].copy()
+    Cx_max[max_Age] = 0.0
+    Nx = _backward_sum(Dx[: max_Age + 1], round_Dx)  # round_Dx kept as in original
+    Mx = _backward_sum(Cx_max, round_Mx)
+    Rx = _backward_sum(Mx, round_Rx)
+
+    cols = CommColumns(lx=lx, tx=tx, Dx=Dx, Cx=Cx, Nx=Nx, Mx=Mx, Rx=Rx)
+    for arr in (lx, tx, Dx, Cx, Nx, Mx, Rx):
+        arr.flags.writeable = False
+    return cols
+
+
+def _backward_sum(values: np.ndarray, digits: int) -> np.ndarray:
+    """VBA: vec(max_Age) = values(max_Age); vec(i) = ROUND(vec(i + 1) + values(i))."""
+    vec = np.zeros(max_Age + 1)
+    vec[max_Age] = values[max_Age]
+    for i in range(max_Age - 1, -1, -1):
+        vec[i] = excel_round(float(vec[i + 1]) + float(values[i]), digits)
+    return vec
+
+
+def _comm_columns(
+    Sex: str,
+    TableId: str,
+    InterestRate: float,
+    BirthYear: int = 0,
+    RetirementAge: int = 0,
+    Layer: int = 1,
+) -> CommColumns:
+    """Cached commutation columns for ages 0..max_Age."""
+    global cache
+    if cache is None:
+        InitializeCache()
+
+    key = (Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
+    cols = cache.get(key)
+    if cols is None:
+        cols = _build_columns(max_Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
+        cache[key] = cols
+    return cols
+
+
+def _columns_up_to(
+    limit: int,
+    Sex: str,
+    TableId: str,
+    InterestRate: float,
+    BirthYear: int,
+    RetirementAge: int,
+    Layer: int,
+) -> CommColumns:
+    """Cached columns if they cover limit, otherwise a one-off build up to limit."""
+    if 0 <= limit <= max_Age:
+        return _comm_columns(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
+    return _build_columns(limit, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
+
+
+def _head_with_zero_tail(column: np.ndarray, limit: int) -> List[float]:
+    """column[0..limit] with the last element set to 0 (VBA loop ends at limit - 1)."""
+    vec = column[: limit + 1].tolist()
+    vec[limit] = 0.0
+    return vec
+
+
 def Vec_lx(
     EndAge: int,
     Sex: str,
@@ -240,15 +400,8 @@ def Vec_lx(
 ) -> List[float]:
     """Creates vector of lx. If EndAge = -1 then up to max_Age."""
     limit = max_Age if EndAge == -1 else EndAge
-    vec: List[float] = [0.0] * (limit + 1)
-
-    vec[0] = 1_000_000.0
-    for i in range(1, limit + 1):
-        qx = Act_qx(i - 1, Sex, TableId, BirthYear, RetirementAge, Layer)
-        vec[i] = vec[i - 1] * (1.0 - qx)
-        vec[i] = excel_round(vec[i], round_lx)
-
-    return vec
+    cols = _columns_up_to(limit, Sex, TableId, 0.0, BirthYear, RetirementAge, Layer)
+    return cols.lx[: limit + 1].tolist()
 
 
 def Act_lx(
@@ -259,8 +412,8 @@ def Act_lx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    vec = Vec_lx(Age, Sex, TableId, BirthYear, RetirementAge, Layer)
-    return float(vec[Age])
+    cols = _columns_up_to(Age, Sex, TableId, 0.0, BirthYear, RetirementAge, Layer)
+    return float(cols.lx[Age])
 
 
 def Vec_tx(
@@ -273,14 +426,8 @@ def Vec_tx(
 ) -> List[float]:
     """Creates vector of tx (# deaths)."""
     limit = max_Age if EndAge == -1 else EndAge
-    vec: List[float] = [0.0] * (limit + 1)
-
-    tempLx = Vec_lx(limit, Sex, TableId, BirthYear, RetirementAge, Layer)
-    for i in range(0, limit):
-        vec[i] = tempLx[i] - tempLx[i + 1]
-        vec[i] = excel_round(vec[i], round_tx)
-
-    return vec
+    cols = _columns_up_to(limit, Sex, TableId, 0.0, BirthYear, RetirementAge, Layer)
+    return _head_with_zero_tail(cols.tx, limit)
 
 
 def Act_tx(
@@ -291,8 +438,9 @@ def Act_tx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    vec = Vec_tx(Age, Sex, TableId, BirthYear, RetirementAge, Layer)
-    return float(vec[Age])
+    # VBA: Vec_tx(Age)(Age), which the loop never fills -> always 0
+    _columns_up_to(Age, Sex, TableId, 0.0, BirthYear, RetirementAge, Layer)
+    return 0.0
 
 
 def Vec_Dx(
@@ -306,15 +454,8 @@ def Vec_Dx(
 ) -> List[float]:
     """Creates vector of Dx."""
     limit = max_Age if EndAge == -1 else EndAge
-    vec: List[float] = [0.0] * (limit + 1)
-
-    v = 1.0 / (1.0 + InterestRate)
-    tempLx = Vec_lx(limit, Sex, TableId, BirthYear, RetirementAge, Layer)
-    for i in range(0, limit + 1):
-        vec[i] = tempLx[i] * (v**i)
-        vec[i] = excel_round(vec[i], round_Dx)
-
-    return vec
+    cols = _columns_up_to(limit, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
+    return cols.Dx[: limit + 1].tolist()
 
 
 def Act_Dx(
@@ -326,18 +467,8 @@ def Act_Dx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    global cache
-    if cache is None:
-        InitializeCache()
-
-    key = BuildCacheKey("Dx", Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    if key in cache:
-        return float(cache[key])
-
-    vec = Vec_Dx(Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    res = float(vec[Age])
-    cache[key] = res
-    return res
+    cols = _columns_up_to(Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
+    return float(cols.Dx[Age])
 
 
 def Vec_Cx(
@@ -351,15 +482,8 @@ def Vec_Cx(
 ) -> List[float]:
     """Creates vector of Cx."""
     limit = max_Age if EndAge == -1 else EndAge
-    vec: List[float] = [0.0] * (limit + 1)
-
-    v = 1.0 / (1.0 + InterestRate)
-    tempTx = Vec_tx(limit, Sex, TableId, BirthYear, RetirementAge, Layer)
-    for i in range(0, limit):
-        vec[i] = tempTx[i] * (v ** (i + 1))
-        vec[i] = excel_round(vec[i], round_Cx)
-
-    return vec
+    cols = _columns_up_to(limit, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
+    return _head_with_zero_tail(cols.Cx, limit)
 
 
 def Act_Cx(
@@ -371,18 +495,9 @@ def Act_Cx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    global cache
-    if cache is None:
-        InitializeCache()
-
-    key = BuildCacheKey("Cx", Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    if key in cache:
-        return float(cache[key])
-
-    vec = Vec_Cx(Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    res = float(vec[Age])
-    cache[key] = res
-    return res
+    # VBA: Vec_Cx(Age)(Age), which the loop never fills -> always 0
+    _columns_up_to(Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
+    return 0.0
 
 
 def Vec_Nx(
@@ -394,15 +509,7 @@ def Vec_Nx(
     Layer: int = 1,
 ) -> List[float]:
     """Creates vector of Nx."""
-    vec: List[float] = [0.0] * (max_Age + 1)
-    tempDx = Vec_Dx(-1, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    vec[max_Age] = tempDx[max_Age]
-    for i in range(max_Age - 1, -1, -1):
-        vec[i] = vec[i + 1] + tempDx[i]
-        vec[i] = excel_round(vec[i], round_Dx)  # kept as in original
-
-    return vec
+    return _comm_columns(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer).Nx.tolist()
 
 
 def Act_Nx(
@@ -414,18 +521,7 @@ def Act_Nx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    global cache
-    if cache is None:
-        InitializeCache()
-
-    key = BuildCacheKey("Nx", Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    if key in cache:
-        return float(cache[key])
-
-    vec = Vec_Nx(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    res = float(vec[Age])
-    cache[key] = res
-    return res
+    return float(_comm_columns(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer).Nx[Age])
 
 
 def Vec_Mx(
@@ -437,16 +533,7 @@ def Vec_Mx(
     Layer: int = 1,
 ) -> List[float]:
     """Creates vector of Mx."""
-    vec: List[float] = [0.0] * (max_Age + 1)
-    tempCx = Vec_Cx(-1, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    # Note: in VBA, tempCx(max_Age) exists because Vec_Cx redims to max_Age
-    vec[max_Age] = float(tempCx[max_Age]) if max_Age < len(tempCx) else 0.0
-    for i in range(max_Age - 1, -1, -1):
-        vec[i] = vec[i + 1] + tempCx[i]
-        vec[i] = excel_round(vec[i], round_Mx)
-
-    return vec
+    return _comm_columns(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer).Mx.tolist()
 
 
 def Act_Mx(
@@ -458,18 +545,7 @@ def Act_Mx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    global cache
-    if cache is None:
-        InitializeCache()
-
-    key = BuildCacheKey("Mx", Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    if key in cache:
-        return float(cache[key])
-
-    vec = Vec_Mx(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    res = float(vec[Age])
-    cache[key] = res
-    return res
+    return float(_comm_columns(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer).Mx[Age])
 
 
 def Vec_Rx(
@@ -481,15 +557,7 @@ def Vec_Rx(
     Layer: int = 1,
 ) -> List[float]:
     """Creates vector of Rx."""
-    vec: List[float] = [0.0] * (max_Age + 1)
-    tempMx = Vec_Mx(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-
-    vec[max_Age] = tempMx[max_Age]
-    for i in range(max_Age - 1, -1, -1):
-        vec[i] = vec[i + 1] + tempMx[i]
-        vec[i] = excel_round(vec[i], round_Rx)
-
-    return vec
+    return _comm_columns(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer).Rx.tolist()
 
 
 def Act_Rx(
@@ -501,18 +569,7 @@ def Act_Rx(
     RetirementAge: int = 0,
     Layer: int = 1,
 ) -> float:
-    global cache
-    if cache is None:
-        InitializeCache()
-
-    key = BuildCacheKey("Rx", Age, Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    if key in cache:
-        return float(cache[key])
-
-    vec = Vec_Rx(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer)
-    res = float(vec[Age])
-    cache[key] = res
-    return res
+    return float(_comm_columns(Sex, TableId, InterestRate, BirthYear, RetirementAge, Layer).Rx[Age])
 
 
 def Act_AgeCalculation(BirthDate: date, ValuationDate: date, Method: str) -> int:
@@ -26,7 +26,7 @@ Then:
 
 from __future__ import annotations
 
-import csv
+from itertools import islice
 from pathlib import Path
 
 
@@ -48,20 +48,12 @@ def _find_source_dir(base: Path) -> Path:
 def _copy_csv_head(src: Path, dst: Path, max_data_rows: int) -> None:
     """
     Copy CSV header + up to max_data_rows data rows (not counting header).
+    Copies raw lines byte for byte (the extracts have no quoted embedded newlines);
+    an empty file yields an empty copy (tests will fail, which is correct).
     """
     dst.parent.mkdir(parents=True, exist_ok=True)
-    with src.open("r", newline="", encoding="utf-8") as f_in, dst.open("w", newline="", encoding="utf-8") as f_out:
-        r = csv.reader(f_in)
-        w = csv.writer(f_out)
-        header = next(r, None)
-        if header is None:
-            # Empty file: still write nothing (tests will fail, which is correct)
-            return
-        w.writerow(header)
-        for i, row in enumerate(r):
-            if i >= max_data_rows:
-                break
-            w.writerow(row)
+    with src.open("rb") as f_in, dst.open("wb") as f_out:
+        f_out.writelines(islice(f_in, max_data_rows + 1))
 
 
 def _write_text(path: Path, text: str) -> None:
@@ -79,16 +71,27 @@ def main() -> int:
     conftest_py = """\
 from __future__ import annotations
 
-import csv
+import importlib.util
 import shutil
+import sys
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from types import ModuleType
+from typing import Callable
 
 import pytest
 
+OUT_DIR = Path(__file__).resolve().parents[1]  # .../Bartek/output
+
+# Once at collection time, so tests can `import outfunc` / `import basfunct` at module scope
+if str(OUT_DIR) not in sys.path:
+    sys.path.insert(0, str(OUT_DIR))
+
 
 def _find_source_dir() -> Path:
     # Prefer repo layout: data files next to /Bartek/output
-    here = Path(__file__).resolve().parents[1]
+    here = OUT_DIR
     required = ["var.csv", "tariff.csv", "limits.csv", "tables.csv", "tariff.py"]
     if all((here / f).exists() for f in required):
         return here
@@ -103,18 +106,10 @@ def _find_source_dir() -> Path:
 
 
 def _copy_csv_head(src: Path, dst: Path, max_data_rows: int) -> None:
+    # Header + up to max_data_rows data rows, copied as raw lines
     dst.parent.mkdir(parents=True, exist_ok=True)
-    with src.open("r", newline="", encoding="utf-8") as f_in, dst.open("w", newline="", encoding="utf-8") as f_out:
-        r = csv.reader(f_in)
-        w = csv.writer(f_out)
-        header = next(r, None)
-        if header is None:
-            return
-        w.writerow(header)
-        for i, row in enumerate(r):
-            if i >= max_data_rows:
-                break
-            w.writerow(row)
+    with src.open("rb") as f_in, dst.open("wb") as f_out:
+        f_out.writelines(islice(f_in, max_data_rows + 1))
 
 
 @pytest.fixture(scope="session")
@@ -133,63 +128,112 @@ def sample_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     shutil.copyfile(src / "tariff.py", tmp / "tariff.py")
 
     return tmp
+
+
+@lru_cache(maxsize=None)
+def _load_module(name: str, path_str: str, mtime_ns: int) -> ModuleType:
+    # Executes a module file once per (name, path, mtime)
+    spec = importlib.util.spec_from_file_location(name, path_str)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Could not load module spec: {path_str}")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod  # before exec, so dataclasses resolve string annotations
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="session")
+def load_module() -> Callable[[str, Path], ModuleType]:
+    \"\"\"Shared loader (name, path) -> module; each file is executed once per session.\"\"\"
+
+    def _load(name: str, path: Path) -> ModuleType:
+        return _load_module(name, str(path), path.stat().st_mtime_ns)
+
+    return _load
 """
 
     test_py = """\
 from __future__ import annotations
 
 import csv
-import importlib.util
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List
 
 import pytest
 
 
-def _read_csv(path: Path) -> tuple[List[str], List[List[str]]]:
-    with path.open("r", newline="", encoding="utf-8") as f:
+def _read_csv_header_and_count(path: Path, min_rows: int) -> tuple[List[str], int]:
+    # Header and data row count; counting stops once min_rows rows have been seen.
+    # Rows are consumed by islice/sum without binding them in Python code.
+    with path.open("r", newline="", encoding="utf-8", buffering=1 << 20) as f:
         r = csv.reader(f)
         header = next(r, [])
-        rows = [row for row in r]
-    return header, rows
+        count = sum(1 for _ in islice(r, min_rows))
+    return header, count
 
 
-def _load_module_from_path(name: str, path: Path):
-    spec = importlib.util.spec_from_file_location(name, path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Could not load module spec: {path}")
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
+# filename -> (expected_cols, min_rows)
+_CSV_EXPECTATIONS = {
+    "var.csv": (2, 1),
+    "tariff.csv": (2, 1),
+    "limits.csv": (2, 1),
+    "tables.csv": (5, 100),
+}
+
+
+@pytest.fixture(scope="session")
+def csv_headers_and_counts(sample_dir: Path) -> Dict[str, tuple[List[str], int]]:
+    # All sample CSVs read once per session; missing files are left out
+    return {
+        name: _read_csv_header_and_count(sample_dir / name, min_rows)
+        for name, (_, min_rows) in _CSV_EXPECTATIONS.items()
+        if (sample_dir / name).exists()
+    }
 
 
 @pytest.mark.parametrize(
     "filename,expected_cols,min_rows",
-    [
-        ("var.csv", 2, 1),
-        ("tariff.csv", 2, 1),
-        ("limits.csv", 2, 1),
-        ("tables.csv", 5, 100),
-    ],
+    [(name, cols, min_rows) for name, (cols, min_rows) in _CSV_EXPECTATIONS.items()],
 )
-def test_data_roundtrip_counts(sample_dir: Path, filename: str, expected_cols: int, min_rows: int) -> None:
-    path = sample_dir / filename
-    assert path.exists(), f"Missing {filename} in sample_dir: {sample_dir}"
-
-    header, rows = _read_csv(path)
+def test_data_roundtrip_counts(
+    sample_dir: Path,
+    csv_headers_and_counts: Dict[str, tuple[List[str], int]],
+    filename: str,
+    expected_cols: int,
+    min_rows: int,
+) -> None:
+    assert filename in csv_headers_and_counts, f"Missing {filename} in sample_dir: {sample_dir}"
+
+    header, row_count = csv_headers_and_counts[filename]
     assert len(header) == expected_cols, f"{filename}: expected {expected_cols} columns, got {len(header)} ({header})"
-    assert len(rows) >= min_rows, f"{filename}: expected >= {min_rows} data rows, got {len(rows)}"
+    assert row_count >= min_rows, f"{filename}: expected >= {min_rows} data rows, got {row_count}"
 
 
-def test_tariff_module_smoke(sample_dir: Path) -> None:
+@pytest.fixture(scope="session")
+def tariff_module(sample_dir: Path, load_module):
+    # tariff.py from sample_dir, loaded once per session
     tariff_path = sample_dir / "tariff.py"
     assert tariff_path.exists()
+    return load_module("tariff_sample", tariff_path)
 
-    tariff = _load_module_from_path("tariff_sample", tariff_path)
+
+def test_tariff_module_smoke(tariff_module) -> None:
+    tariff = tariff_module
     assert hasattr(tariff, "ModalSurcharge")
 
     # Known from the Excel formula used in Task 3 export
     assert abs(float(tariff.ModalSurcharge(12)) - 0.05) < 1e-12
+
+
+# Calculation!E12: =IF(PayFreq=2,2%,IF(PayFreq=4,3%,IF(PayFreq=12,5%,0)))
+_MODAL_SURCHARGE_EXPECTED = {1: 0.0, 2: 0.02, 4: 0.03, 12: 0.05}
+
+
+@pytest.mark.parametrize("pay_freq,expected", sorted(_MODAL_SURCHARGE_EXPECTED.items()))
+def test_tariff_modal_surcharge_table(tariff_module, pay_freq: int, expected: float) -> None:
+    # Reuses the session-loaded tariff module; tariff.py is executed once for all cases
+    assert abs(float(tariff_module.ModalSurcharge(pay_freq)) - expected) < 1e-12
 """
 
     _write_text(tests_dir / "conftest.py", conftest_py)
@@ -32,11 +32,11 @@ K9:
 
 from __future__ import annotations
 
+import csv
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
-
-import pandas as pd
+from typing import Dict, Optional, Tuple
 
 import basfunct
 import tariff as tariff_mod
@@ -47,17 +47,32 @@ def _data_dir() -> Path:
     return Path(__file__).resolve().parent
 
 
-def _load_name_value_csv(path: Path) -> Dict[str, str]:
-    df = pd.read_csv(path, dtype=str).fillna("")
-    if "Name" not in df.columns or "Value" not in df.columns:
-        raise ValueError(f"{path.name} must have columns: Name, Value")
-    out: Dict[str, str] = {}
-    for n, v in zip(df["Name"], df["Value"]):
-        name = str(n).strip()
+# basfunct reads tables.csv from the same dir; set once at import so tables.csv is
+# loaded once per process, independent of the tariff params cache.
+basfunct.set_data_dir(_data_dir())
+
+
+@lru_cache(maxsize=16)
+def _load_name_value_csv_cached(path_str: str) -> Tuple[Tuple[str, str], ...]:
+    """(name, value) pairs of a Name/Value CSV; read once per file path and process, like _params_cache."""
+    with open(path_str, newline="", encoding="utf-8-sig") as f:
+        rows = [row for row in csv.reader(f) if row]  # blank lines skipped, as pandas does
+    header = [h.strip() for h in rows[0]] if rows else []
+    if "Name" not in header or "Value" not in header:
+        raise ValueError(f"{Path(path_str).name} must have columns: Name, Value")
+    ni, vi = header.index("Name"), header.index("Value")
+
+    out = []
+    for row in rows[1:]:
+        name = row[ni].strip() if ni < len(row) else ""
         if not name:
             continue
-        out[name] = str(v).strip()
-    return out
+        out.append((name, row[vi].strip() if vi < len(row) else ""))
+    return tuple(out)
+
+
+def _load_name_value_csv(path: Path) -> Dict[str, str]:
+    return dict(_load_name_value_csv_cached(str(path)))
 
 
 def _to_float(d: Dict[str, str], key: str) -> float:
@@ -107,13 +122,44 @@ def _get_tariff_params() -> TariffParams:
     if not params.mortality_table:
         raise ValueError("MortalityTable is empty in tariff.csv")
 
-    # Ensure basfunct reads tables.csv from the same dir
-    basfunct.set_data_dir(dd)
-
     _params_cache = params
     return params
 
 
+# Memoized basfunct accessors for the premium formulas. basfunct clears them
+# (see the end of this module) when its data dir or commutation cache is reset.
+_Act_Dx = lru_cache(maxsize=None)(basfunct.Act_Dx)
+_Act_axn_k = lru_cache(maxsize=None)(basfunct.Act_axn_k)
+_act_nGrAx = lru_cache(maxsize=None)(basfunct.act_nGrAx)
+
+
+def _bxt_and_components(
+    x: int,
+    n: int,
+    t: int,
+    sex: str,
+    mt: str,
+    ir: float,
+    p: TariffParams,
+) -> Tuple[float, float, float, float, float]:
+    """
+    Excel K5 (Bxt) together with the terms K9 reuses.
+    Returns (rate, axn_t, axn_n, dx_ratio, ngrax).
+    """
+    axn_t = _Act_axn_k(x, t, sex, mt, ir, 1)
+    axn_n = _Act_axn_k(x, n, sex, mt, ir, 1)
+    dx_ratio = _Act_Dx(x + n, sex, mt, ir) / _Act_Dx(x, sex, mt, ir)
+    ngrax = _act_nGrAx(x, n, sex, mt, ir)
+
+    numerator = ngrax + dx_ratio + p.gamma1 * axn_t + p.gamma2 * (axn_n - axn_t)
+    denominator = (1.0 - p.beta1) * axn_t - p.alpha * float(t)
+
+    if denominator == 0.0:
+        raise ZeroDivisionError("Denominator in K5 (Bxt) is zero.")
+
+    return float(numerator / denominator), axn_t, axn_n, dx_ratio, ngrax
+
+
 def NormGrossAnnualPrem(
     sa: float,
     age: int,
@@ -129,31 +175,9 @@ def NormGrossAnnualPrem(
     _ = sa, PayFreq, tariff  # not used in K5 itself
 
     p = _get_tariff_params()
-
-    x = int(age)
-    n_i = int(n)
-    t_i = int(t)
-    sex_s = str(sex)
-
-    mt = p.mortality_table
-    ir = float(p.interest_rate)
-
-    axn_t = basfunct.Act_axn_k(x, t_i, sex_s, mt, ir, 1)
-    axn_n = basfunct.Act_axn_k(x, n_i, sex_s, mt, ir, 1)
-    dx_ratio = basfunct.Act_Dx(x + n_i, sex_s, mt, ir) / basfunct.Act_Dx(x, sex_s, mt, ir)
-
-    numerator = (
-        basfunct.act_nGrAx(x, n_i, sex_s, mt, ir)
-        + dx_ratio
-        + p.gamma1 * axn_t
-        + p.gamma2 * (axn_n - axn_t)
-    )
-    denominator = (1.0 - p.beta1) * axn_t - p.alpha * float(t_i)
-
-    if denominator == 0.0:
-        raise ZeroDivisionError("Denominator in K5 (Bxt) is zero.")
-
-    return float(numerator / denominator)
+    return _bxt_and_components(
+        int(age), int(n), int(t), str(sex), p.mortality_table, float(p.interest_rate), p
+    )[0]
 
 
 def GrossAnnualPrem(
@@ -172,6 +196,10 @@ def GrossAnnualPrem(
     return float(sa) * float(rate)
 
 
+# ModalSurcharge for the usual payment frequencies, tabulated once at import
+_MS_TABLE: Dict[int, float] = {pf: float(tariff_mod.ModalSurcharge(pf)) for pf in (1, 2, 3, 4, 6, 12)}
+
+
 def GrossModalPrem(
     sa: float,
     age: int,
@@ -189,8 +217,15 @@ def GrossModalPrem(
     """
     p = _get_tariff_params()
     annual = GrossAnnualPrem(sa, age, sex, n, t, PayFreq, tariff)
-    ms = float(tariff_mod.ModalSurcharge(PayFreq))
+    return _modal_prem(annual, PayFreq, p)
+
+
+def _modal_prem(annual: float, PayFreq: int, p: TariffParams) -> float:
+    """Excel K7 from the gross annual premium K6."""
     pf = int(PayFreq)
+    ms = _MS_TABLE.get(pf)
+    if ms is None:
+        ms = float(tariff_mod.ModalSurcharge(PayFreq))
     if pf == 0:
         raise ZeroDivisionError("PayFreq must not be 0.")
     return (1.0 + ms) / pf * (annual + p.k)
@@ -215,19 +250,60 @@ def Pxt(
     _ = sa, PayFreq, tariff  # not used directly in K9 formula besides NormGrossAnnualPrem rate
 
     p = _get_tariff_params()
-    x = int(age)
-    n_i = int(n)
     t_i = int(t)
-    sex_s = str(sex)
-    mt = p.mortality_table
-    ir = float(p.interest_rate)
 
-    dx_ratio = basfunct.Act_Dx(x + n_i, sex_s, mt, ir) / basfunct.Act_Dx(x, sex_s, mt, ir)
-    axn_t = basfunct.Act_axn_k(x, t_i, sex_s, mt, ir, 1)
+    # K5 and K9 share axn_t, dx_ratio and act_nGrAx; compute them once.
+    rate, axn_t, _axn_n, dx_ratio, ngrax = _bxt_and_components(
+        int(age), int(n), t_i, str(sex), p.mortality_table, float(p.interest_rate), p
+    )
+    return _pxt_from_components(rate, axn_t, dx_ratio, ngrax, t_i, p)
+
+
+def _pxt_from_components(
+    rate: float, axn_t: float, dx_ratio: float, ngrax: float, t: int, p: TariffParams
+) -> float:
+    """Excel K9 from the K5 rate and the shared commutation terms."""
     if axn_t == 0.0:
         raise ZeroDivisionError("Act_axn_k(x,t,...) is zero in K9 denominator.")
 
-    rate = NormGrossAnnualPrem(1.0, x, sex_s, n_i, t_i, int(PayFreq), str(tariff))
-    numerator = basfunct.act_nGrAx(x, n_i, sex_s, mt, ir) + dx_ratio + float(t_i) * p.alpha * rate
+    numerator = ngrax + dx_ratio + float(t) * p.alpha * rate
     return float(numerator / axn_t)
 
+
+def compute_all(
+    sa: float,
+    age: int,
+    sex: str,
+    n: int,
+    t: int,
+    PayFreq: int,
+    tariff: str = "",
+) -> Dict[str, float]:
+    """
+    NormGrossAnnualPrem, GrossAnnualPrem, GrossModalPrem and Pxt from one shared
+    set of commutation terms. Values are identical to calling each function.
+    """
+    _ = tariff
+
+    p = _get_tariff_params()
+    t_i = int(t)
+    rate, axn_t, _axn_n, dx_ratio, ngrax = _bxt_and_components(
+        int(age), int(n), t_i, str(sex), p.mortality_table, float(p.interest_rate), p
+    )
+    annual = float(sa) * float(rate)
+    return {
+        "NormGrossAnnualPrem": rate,
+        "GrossAnnualPrem": annual,
+        "GrossModalPrem": _modal_prem(annual, PayFreq, p),
+        "Pxt": _pxt_from_components(rate, axn_t, dx_ratio, ngrax, t_i, p),
+    }
+
+
+# Outer-level memoization: results depend on the arguments, tariff.csv (read once
+# per process by _get_tariff_params) and basfunct's tables.
+GrossAnnualPrem = lru_cache(maxsize=1024)(GrossAnnualPrem)
+Pxt = lru_cache(maxsize=1024)(Pxt)
+
+# Drop all memoized results whenever basfunct.set_data_dir() / InitializeCache() run
+for _memo in (_Act_Dx, _Act_axn_k, _act_nGrAx, GrossAnnualPrem, Pxt):
+    basfunct.register_dependent_cache(_memo.cache_clear)
@@ -4,10 +4,10 @@ run_calc.py
 
 Minimal CLI runner for calculator output functions (Task 7).
 
-- Loads inputs from var.csv and tariff.csv using pandas.
+- Loads inputs from var.csv (stdlib csv, re-read on every run).
 - Uses ONLY the exact variable names present in the CSV files produced in Task 3:
     var.csv   -> x, Sex, n, t, SumInsured, PayFreq
-    tariff.csv-> (loaded but not required for the function call arguments)
+    tariff.csv-> (read by outfunc itself; not required for the function call arguments)
 - Maps these exact CSV fields to the function signature required by outfunc.py:
     sa      <- SumInsured
     age     <- x
@@ -23,14 +23,13 @@ Minimal CLI runner for calculator output functions (Task 7).
 from __future__ import annotations
 
 import argparse
+import csv
 import json
 import sys
 from importlib import import_module
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import pandas as pd
-
 ALL_FUNCS = [
     "NormGrossAnnualPrem",
     "GrossAnnualPrem",
@@ -44,15 +43,19 @@ def _script_dir() -> Path:
 
 
 def _read_name_value(path: Path) -> Dict[str, str]:
-    df = pd.read_csv(path, dtype=str).fillna("")
-    if "Name" not in df.columns or "Value" not in df.columns:
+    # Read on every call (not cached), so an edited var.csv is picked up by the next main()
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        rows = [row for row in csv.reader(f) if row]  # blank lines skipped, as pandas does
+    header = [h.strip() for h in rows[0]] if rows else []
+    if "Name" not in header or "Value" not in header:
         raise ValueError(f"{path}: expected columns 'Name' and 'Value'")
+    ni, vi = header.index("Name"), header.index("Value")
+
     out: Dict[str, str] = {}
-    for n, v in zip(df["Name"], df["Value"]):
-        key = str(n).strip()
-        if not key:
-            continue
-        out[key] = str(v).strip()
+    for row in rows[1:]:
+        name = row[ni].strip() if ni < len(row) else ""
+        if name:
+            out[name] = row[vi].strip() if vi < len(row) else ""
     return out
 
 
@@ -80,7 +83,14 @@ def _as_float(v: str, name: str) -> float:
 def _parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Run product calculator output functions from outfunc.py and print JSON.")
     p.add_argument("--var-file", default="var.csv", help="Variables CSV file (default: var.csv)")
-    p.add_argument("--tariff-file", default="tariff.csv", help="Tariff CSV file (default: tariff.csv)")
+    p.add_argument(
+        "--tariff-file",
+        default="tariff.csv",
+        help=(
+            "Tariff CSV file (default: tariff.csv). The tariff always comes from outfunc's data dir "
+            "(the tariff.csv next to outfunc.py); any other file is rejected."
+        ),
+    )
     p.add_argument(
         "--funcs",
         default="",
@@ -91,7 +101,12 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         action="store_true",
         help="Run all known functions (default if --funcs is not given)",
     )
-    return p.parse_args(argv)
+    args = p.parse_args(argv)
+
+    tariff_csv = _script_dir() / "tariff.csv"
+    if _resolve_path(args.tariff_file, _script_dir()).resolve() != tariff_csv.resolve():
+        p.error(f"--tariff-file {args.tariff_file!r} is not supported; outfunc reads {tariff_csv}")
+    return args
 
 
 def _resolve_path(p: str, base_dir: Path) -> Path:
@@ -99,15 +114,14 @@ def _resolve_path(p: str, base_dir: Path) -> Path:
     return path if path.is_absolute() else (base_dir / path)
 
 
-def _load_inputs(var_file: Path, tariff_file: Path) -> Dict[str, Any]:
+def _load_inputs(var_file: Path) -> Dict[str, Any]:
     """
     Load ONLY the exact variables provided in var.csv (Task 3 extract):
       x, Sex, n, t, SumInsured, PayFreq
 
-    tariff.csv is loaded (per spec) but not needed for these call arguments.
+    tariff.csv is not read here; outfunc loads it for the tariff parameters.
     """
     var_map = _read_name_value(var_file)
-    _ = _read_name_value(tariff_file)  # loaded as specified; not used in input args here
 
     required_var_keys = ["x", "Sex", "n", "t", "SumInsured", "PayFreq"]
     missing = [k for k in required_var_keys if k not in var_map or str(var_map[k]).strip() == ""]
@@ -132,13 +146,12 @@ def main(argv: list[str]) -> int:
 
     base_dir = _script_dir()
     var_path = _resolve_path(args.var_file, base_dir)
-    tariff_path = _resolve_path(args.tariff_file, base_dir)
 
     # Ensure outfunc.py and its sibling modules (basfunct.py, tariff.py, CSVs) are importable.
     if str(base_dir) not in sys.path:
         sys.path.insert(0, str(base_dir))
 
-    input_args = _load_inputs(var_path, tariff_path)
+    input_args = _load_inputs(var_path)
 
     funcs_to_run = (
         ALL_FUNCS if args.all or not args.funcs else [s.strip() for s in args.funcs.split(",") if s.strip()]
@@ -147,7 +160,13 @@ def main(argv: list[str]) -> int:
     outfunc = import_module("outfunc")
     results: Dict[str, Any] = {}
 
+    # One shared computation for the premium functions instead of one call each
+    batch = outfunc.compute_all(**input_args) if any(name in ALL_FUNCS for name in funcs_to_run) else {}
+
     for name in funcs_to_run:
+        if name in batch:
+            results[name] = batch[name]
+            continue
         func = getattr(outfunc, name, None)
         if func is None or getattr(func, "__doc__", None) == "PLACEHOLDER":
             results[name] = "not yet implemented"
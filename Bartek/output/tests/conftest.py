@@ -1,15 +1,26 @@
 from __future__ import annotations
 
-import csv
+import importlib.util
 import shutil
+import sys
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from types import ModuleType
+from typing import Callable
 
 import pytest
 
+OUT_DIR = Path(__file__).resolve().parents[1]  # .../Bartek/output
+
+# Once at collection time, so tests can `import outfunc` / `import basfunct` at module scope
+if str(OUT_DIR) not in sys.path:
+    sys.path.insert(0, str(OUT_DIR))
+
 
 def _find_source_dir() -> Path:
     # Prefer repo layout: data files next to /Bartek/output
-    here = Path(__file__).resolve().parents[1]
+    here = OUT_DIR
     required = ["var.csv", "tariff.csv", "limits.csv", "tables.csv", "tariff.py"]
     if all((here / f).exists() for f in required):
         return here
@@ -24,18 +35,10 @@ def _find_source_dir() -> Path:
 
 
 def _copy_csv_head(src: Path, dst: Path, max_data_rows: int) -> None:
+    # Header + up to max_data_rows data rows, copied as raw lines
     dst.parent.mkdir(parents=True, exist_ok=True)
-    with src.open("r", newline="", encoding="utf-8") as f_in, dst.open("w", newline="", encoding="utf-8") as f_out:
-        r = csv.reader(f_in)
-        w = csv.writer(f_out)
-        header = next(r, None)
-        if header is None:
-            return
-        w.writerow(header)
-        for i, row in enumerate(r):
-            if i >= max_data_rows:
-                break
-            w.writerow(row)
+    with src.open("rb") as f_in, dst.open("wb") as f_out:
+        f_out.writelines(islice(f_in, max_data_rows + 1))
 
 
 @pytest.fixture(scope="session")
@@ -54,3 +57,25 @@ def sample_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     shutil.copyfile(src / "tariff.py", tmp / "tariff.py")
 
     return tmp
+
+
+@lru_cache(maxsize=None)
+def _load_module(name: str, path_str: str, mtime_ns: int) -> ModuleType:
+    # Executes a module file once per (name, path, mtime)
+    spec = importlib.util.spec_from_file_location(name, path_str)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Could not load module spec: {path_str}")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod  # before exec, so dataclasses resolve string annotations
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="session")
+def load_module() -> Callable[[str, Path], ModuleType]:
+    """Shared loader (name, path) -> module; each file is executed once per session."""
+
+    def _load(name: str, path: Path) -> ModuleType:
+        return _load_module(name, str(path), path.stat().st_mtime_ns)
+
+    return _load
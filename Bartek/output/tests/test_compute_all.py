@@ -0,0 +1,40 @@
+# tests/test_compute_all.py
+from __future__ import annotations
+
+import outfunc
+
+
+def test_compute_all_matches_single_functions() -> None:
+    sa = 100_000
+    age = 40
+    sex = "M"
+    n = 30
+    t = 20
+    PayFreq = 12
+    tariff = "KLV"
+
+    got = outfunc.compute_all(sa, age, sex, n, t, PayFreq, tariff)
+
+    assert set(got) == {"NormGrossAnnualPrem", "GrossAnnualPrem", "GrossModalPrem", "Pxt"}
+    for name, value in got.items():
+        expected = getattr(outfunc, name)(sa, age, sex, n, t, PayFreq, tariff)
+        assert value == expected, f"{name}: got={value!r}, expected={expected!r}"
+
+
+def test_set_data_dir_clears_premium_memos(tmp_path) -> None:
+    # tables.csv with the M and F columns swapped: M premiums must become the F ones
+    src = outfunc._data_dir() / "tables.csv"
+    header, rest = src.read_text(encoding="utf-8").split("\n", 1)
+    swapped = header.replace("_M", "_X").replace("_F", "_M").replace("_X", "_F")
+    (tmp_path / "tables.csv").write_text(swapped + "\n" + rest, encoding="utf-8")
+
+    args = (100_000, 40, "M", 30, 20, 12, "KLV")
+    female = (100_000, 40, "F", 30, 20, 12, "KLV")
+    expected = outfunc.GrossAnnualPrem(*female), outfunc.Pxt(*female)
+    before = outfunc.GrossAnnualPrem(*args), outfunc.Pxt(*args)
+    try:
+        outfunc.basfunct.set_data_dir(tmp_path)
+        assert (outfunc.GrossAnnualPrem(*args), outfunc.Pxt(*args)) == expected
+    finally:
+        outfunc.basfunct.set_data_dir(outfunc._data_dir())
+    assert (outfunc.GrossAnnualPrem(*args), outfunc.Pxt(*args)) == before
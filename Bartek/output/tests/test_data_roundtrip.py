@@ -1,54 +1,81 @@
 from __future__ import annotations
 
 import csv
-import importlib.util
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List
 
 import pytest
 
 
-def _read_csv(path: Path) -> tuple[List[str], List[List[str]]]:
-    with path.open("r", newline="", encoding="utf-8") as f:
+def _read_csv_header_and_count(path: Path, min_rows: int) -> tuple[List[str], int]:
+    # Header and data row count; counting stops once min_rows rows have been seen.
+    # Rows are consumed by islice/sum without binding them in Python code.
+    with path.open("r", newline="", encoding="utf-8", buffering=1 << 20) as f:
         r = csv.reader(f)
         header = next(r, [])
-        rows = [row for row in r]
-    return header, rows
+        count = sum(1 for _ in islice(r, min_rows))
+    return header, count
 
 
-def _load_module_from_path(name: str, path: Path):
-    spec = importlib.util.spec_from_file_location(name, path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Could not load module spec: {path}")
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
+# filename -> (expected_cols, min_rows)
+_CSV_EXPECTATIONS = {
+    "var.csv": (2, 1),
+    "tariff.csv": (2, 1),
+    "limits.csv": (2, 1),
+    "tables.csv": (5, 100),
+}
+
+
+@pytest.fixture(scope="session")
+def csv_headers_and_counts(sample_dir: Path) -> Dict[str, tuple[List[str], int]]:
+    # All sample CSVs read once per session; missing files are left out
+    return {
+        name: _read_csv_header_and_count(sample_dir / name, min_rows)
+        for name, (_, min_rows) in _CSV_EXPECTATIONS.items()
+        if (sample_dir / name).exists()
+    }
 
 
 @pytest.mark.parametrize(
     "filename,expected_cols,min_rows",
-    [
-        ("var.csv", 2, 1),
-        ("tariff.csv", 2, 1),
-        ("limits.csv", 2, 1),
-        ("tables.csv", 5, 100),
-    ],
+    [(name, cols, min_rows) for name, (cols, min_rows) in _CSV_EXPECTATIONS.items()],
 )
-def test_data_roundtrip_counts(sample_dir: Path, filename: str, expected_cols: int, min_rows: int) -> None:
-    path = sample_dir / filename
-    assert path.exists(), f"Missing {filename} in sample_dir: {sample_dir}"
+def test_data_roundtrip_counts(
+    sample_dir: Path,
+    csv_headers_and_counts: Dict[str, tuple[List[str], int]],
+    filename: str,
+    expected_cols: int,
+    min_rows: int,
+) -> None:
+    assert filename in csv_headers_and_counts, f"Missing {filename} in sample_dir: {sample_dir}"
 
-    header, rows = _read_csv(path)
+    header, row_count = csv_headers_and_counts[filename]
     assert len(header) == expected_cols, f"{filename}: expected {expected_cols} columns, got {len(header)} ({header})"
-    assert len(rows) >= min_rows, f"{filename}: expected >= {min_rows} data rows, got {len(rows)}"
+    assert row_count >= min_rows, f"{filename}: expected >= {min_rows} data rows, got {row_count}"
 
 
-def test_tariff_module_smoke(sample_dir: Path) -> None:
+@pytest.fixture(scope="session")
+def tariff_module(sample_dir: Path, load_module):
+    # tariff.py from sample_dir, loaded once per session
     tariff_path = sample_dir / "tariff.py"
     assert tariff_path.exists()
+    return load_module("tariff_sample", tariff_path)
 
-    tariff = _load_module_from_path("tariff_sample", tariff_path)
+
+def test_tariff_module_smoke(tariff_module) -> None:
+    tariff = tariff_module
     assert hasattr(tariff, "ModalSurcharge")
 
     # Known from the Excel formula used in Task 3 export
     assert abs(float(tariff.ModalSurcharge(12)) - 0.05) < 1e-12
+
+
+# Calculation!E12: =IF(PayFreq=2,2%,IF(PayFreq=4,3%,IF(PayFreq=12,5%,0)))
+_MODAL_SURCHARGE_EXPECTED = {1: 0.0, 2: 0.02, 4: 0.03, 12: 0.05}
+
+
+@pytest.mark.parametrize("pay_freq,expected", sorted(_MODAL_SURCHARGE_EXPECTED.items()))
+def test_tariff_modal_surcharge_table(tariff_module, pay_freq: int, expected: float) -> None:
+    # Reuses the session-loaded tariff module; tariff.py is executed once for all cases
+    assert abs(float(tariff_module.ModalSurcharge(pay_freq)) - expected) < 1e-12
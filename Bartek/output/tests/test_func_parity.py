@@ -2,19 +2,26 @@
 from __future__ import annotations
 
 import ast
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Set
+from typing import FrozenSet, Iterable, Optional, Set, Tuple
 
+_OUT_DIR = Path(__file__).resolve().parents[1]  # .../Bartek/output
 
+
+# One declaration per line, matched over the raw bytes of the whole file
+# (bytes patterns are ASCII-only):
+# - optional "Public", then Function/Sub and the name, then the rest of the line
+# - Private/Friend declarations cannot match: only Public may precede Function/Sub
+# - comment and Attribute lines cannot match either, for the same reason
+# - "Declare Function/Sub" lines (WinAPI declarations) are excluded by the lookahead
 _VBA_PUBLIC_DECL_RE = re.compile(
-    r"""^\s*
-    (?P<scope>Public|Private|Friend)?\s*
-    (?P<kind>Function|Sub)\s+
-    (?P<name>[A-Za-z_]\w*)
-    \b
-    """,
-    re.IGNORECASE | re.VERBOSE,
+    rb"(?im)^(?![^\n]*\bdeclare[ \t]+(?:function|sub)\b)"
+    rb"[ \t]*(?:Public[ \t]*)?"
+    rb"(?:Function|Sub)[ \t]+(?P<name>[A-Za-z_]\w*)\b[^\n]*"
 )
 
 
@@ -23,17 +30,32 @@ def _find_vba_module_files() -> list[Path]:
     Prefer repo layout: Mod_*.txt next to /Bartek/output (parent of ./tests).
     Fallback to /mnt/data for sandbox runs.
     """
-    out_dir = Path(__file__).resolve().parents[1]
-    files = sorted(out_dir.glob("Mod_*.txt"))
+    files = _list_mod_files(_OUT_DIR)
     if files:
         return files
 
+    mnt = _mnt_data_dir()
+    return _list_mod_files(mnt) if mnt is not None else []
+
+
+@lru_cache(maxsize=1)
+def _mnt_data_dir() -> Optional[Path]:
+    """/mnt/data if it is a directory; probed once, and only when a fallback is needed."""
     mnt = Path("/mnt/data")
-    files = sorted(mnt.glob("Mod_*.txt"))
-    return files
+    return mnt if mnt.is_dir() else None
+
+
+def _list_mod_files(directory: Path) -> list[Path]:
+    # One scandir pass; DirEntry.is_file() uses the cached entry type, no stat per file
+    try:
+        with os.scandir(directory) as it:
+            names = [e.name for e in it if e.name.startswith("Mod_") and e.name.endswith(".txt") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    return [directory / name for name in sorted(names)]
 
 
-def _extract_public_vba_names(vba_text: str) -> Set[str]:
+def _extract_public_vba_names(vba_text: bytes) -> Set[str]:
     """
     Collect all VBA Function/Sub names that are public by the rule:
     - include declarations that are NOT marked Private
@@ -41,48 +63,20 @@ def _extract_public_vba_names(vba_text: str) -> Set[str]:
     - ignore 'Declare Function/Sub' (WinAPI declarations)
     """
     names: Set[str] = set()
-
-    for raw in vba_text.splitlines():
-        line = raw.strip()
-
-        # Ignore empty and comment-only lines
-        if not line or line.startswith("'"):
-            continue
-
-        # Ignore Attribute lines
-        if line.lower().startswith("attribute "):
-            continue
-
-        # Ignore Declare statements (e.g., Declare Function ...)
-        if re.search(r"\bdeclare\s+(function|sub)\b", line, flags=re.IGNORECASE):
-            continue
-
-        m = _VBA_PUBLIC_DECL_RE.match(line)
-        if not m:
-            continue
-
-        scope = (m.group("scope") or "").strip().lower()
-        if scope == "private":
-            continue
-        if scope == "friend":
-            continue
-
-        name = m.group("name").strip()
-        if name:
-            names.add(name.lower())
+    for m in _VBA_PUBLIC_DECL_RE.finditer(vba_text):
+        names.add(m.group("name").lower().decode("ascii"))
 
     return names
 
 
 def _find_basfunct_path() -> Path:
-    out_dir = Path(__file__).resolve().parents[1]
-    candidate = out_dir / "basfunct.py"
+    candidate = _OUT_DIR / "basfunct.py"
     if candidate.exists():
         return candidate
 
-    mnt = Path("/mnt/data") / "basfunct.py"
-    if mnt.exists():
-        return mnt
+    mnt = _mnt_data_dir()
+    if mnt is not None and (mnt / "basfunct.py").exists():
+        return mnt / "basfunct.py"
 
     raise FileNotFoundError("basfunct.py not found next to tests/ or in /mnt/data.")
 
@@ -100,18 +94,40 @@ def _extract_python_def_names(py_text: str) -> Set[str]:
     return names
 
 
+@lru_cache(maxsize=4)
+def _public_vba_names_in_files(files: Tuple[Tuple[str, int], ...]) -> FrozenSet[str]:
+    """
+    Public VBA names of all given (path, mtime_ns) files: the files are read in
+    parallel, joined into one bytes buffer (no decoding) and scanned in a single
+    finditer pass; cached per file set.
+    """
+    paths = [Path(path_str) for path_str, _ in files]
+    if len(paths) > 1:
+        # File reads release the GIL; map() keeps the input order
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+            chunks = list(ex.map(Path.read_bytes, paths))
+    else:
+        chunks = [p.read_bytes() for p in paths]
+    blob = b"\n".join(chunks)
+    return frozenset(_extract_public_vba_names(blob))
+
+
+@lru_cache(maxsize=4)
+def _python_def_names_in_file(path_str: str, mtime_ns: int) -> FrozenSet[str]:
+    """Top-level def names of a Python file; parsed once per path and mtime."""
+    return frozenset(_extract_python_def_names(Path(path_str).read_text(encoding="utf-8")))
+
+
 def test_vba_to_python_function_parity() -> None:
     vba_files = _find_vba_module_files()
     assert vba_files, "No Mod_*.txt VBA module exports found."
 
-    vba_names: Set[str] = set()
-    for p in vba_files:
-        vba_names |= _extract_public_vba_names(p.read_text(encoding="utf-8", errors="ignore"))
+    vba_names = _public_vba_names_in_files(tuple((str(p), p.stat().st_mtime_ns) for p in vba_files))
 
     assert vba_names, "No public VBA Function/Sub declarations found in Mod_*.txt files."
 
     basfunct_path = _find_basfunct_path()
-    py_names = _extract_python_def_names(basfunct_path.read_text(encoding="utf-8"))
+    py_names = _python_def_names_in_file(str(basfunct_path), basfunct_path.stat().st_mtime_ns)
 
     # For each public VBA name, exactly one Python def should exist.
     # (Python module cannot have true duplicate def names; so this reduces to membership.)
@@ -0,0 +1,28 @@
+# tests/test_outfunc_values.py
+from __future__ import annotations
+
+import pytest
+
+import outfunc
+
+
+@pytest.mark.parametrize(
+    "fn_name, expected",
+    [
+        ("NormGrossAnnualPrem", 0.04226001),
+        ("Pxt", 0.04001217),
+    ],
+)
+def test_outfunc_values(fn_name: str, expected: float) -> None:
+    sa = 100_000
+    age = 40
+    sex = "M"
+    n = 30
+    t = 20
+    PayFreq = 12
+    tariff = "KLV"
+
+    tol = 1e-8
+
+    got = float(getattr(outfunc, fn_name)(sa, age, sex, n, t, PayFreq, tariff))
+    assert abs(got - expected) <= tol, f"{fn_name}: got={got:.12f}, expected={expected:.12f}, tol={tol}"